@@ -1,25 +1,44 @@
 import asyncio
+import hashlib
 import os
+import shutil
+import tempfile
+from contextlib import suppress
+import pybase64
 from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Optional
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Optional
 import sys
 
-# Add social-media-updater to path
-social_media_path = os.path.join(os.path.dirname(__file__), 'social-media-updater')
+# linkedin.py and simplify.py are imported as top-level modules by social_media_updater.utils
+social_media_path = os.path.join(os.path.dirname(__file__), 'social_media_updater')
 if social_media_path not in sys.path:
     sys.path.insert(0, social_media_path)
 
-# Import the social media functions
-import importlib.util
-spec = importlib.util.spec_from_file_location("social_utils", os.path.join(social_media_path, "utils.py"))
-social_utils = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(social_utils)
-update_linkedin_from_convex = social_utils.update_linkedin_from_convex
-update_simplify_from_convex = social_utils.update_simplify_from_convex
+from social_media_updater.utils import update_linkedin_from_convex, update_simplify_from_convex
+from resume_builder.utils import export_to_latex, export_resume_to_json, get_full_resume
 
-app = FastAPI(title="Resume Social Media API", version="1.0.0")
+# Export formats: file extension and mime type returned to the frontend
+EXPORT_FORMATS = {
+    "pdf": ("pdf", "application/pdf"),
+    "latex": ("tex", "application/x-latex"),
+    "json": ("json", "application/json"),
+}
+
+# Read size for base64 encoding; a multiple of 3 so no chunk gets padded
+B64_CHUNK_SIZE = 48 * 1024
+
+# Seconds allowed for each pdflatex pass
+PDFLATEX_TIMEOUT = 30
+
+# Compiled PDFs keyed by a hash of their LaTeX source, least recently used evicted first
+PDF_CACHE_DIR = os.path.join(tempfile.gettempdir(), "resume_pdf_cache")
+PDF_CACHE_MAX_ENTRIES = 32
+
+app = FastAPI(title="Resume Social Media API", version="1.0.0", default_response_class=ORJSONResponse)
 
 # Add CORS middleware to allow frontend calls
 app.add_middleware(
@@ -31,15 +50,109 @@ app.add_middleware(
 )
 
 class LinkedInExperienceRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore", str_strip_whitespace=True)
+
     experience_id: Optional[str] = None
     experience_index: Optional[int] = None
     action: str = "add"
 
 class SimplifyExperienceRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore", str_strip_whitespace=True)
+
     experience_id: Optional[str] = None
     experience_index: Optional[int] = None
     action: str = "add"
 
+class ResumeSettings(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    fontSize: float = 11
+    margins: float = 0.5
+    lineSpacing: float = 1.0
+
+class ResumeExportRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore", str_strip_whitespace=True)
+
+    format: str = "pdf"
+    filename: str = "resume"
+    selectedExperienceIds: Optional[List[str]] = None
+    selectedProjectIds: Optional[List[str]] = None
+    settings: ResumeSettings = Field(default_factory=ResumeSettings)
+
+def _encode_file_b64(path: str, chunk_size: int = B64_CHUNK_SIZE) -> str:
+    """
+    Base64 encode a file chunk by chunk instead of reading it whole
+
+    Args:
+        path: File to encode
+        chunk_size: Bytes read per iteration (must be a multiple of 3)
+
+    Returns:
+        Base64 encoded file content
+    """
+    encoded = bytearray()
+    with open(path, 'rb') as f:
+        while chunk := f.read(chunk_size):
+            encoded += pybase64.b64encode(chunk)
+    return encoded.decode('ascii')
+
+def _hash_file(path: str) -> str:
+    """
+    Hash a file's content to key the PDF cache
+    """
+    with open(path, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+def _get_cached_pdf(cache_key: str, dest_file: str) -> bool:
+    """
+    Copy a compiled PDF out of the on-disk cache
+
+    The entry is copied rather than returned by path, since another worker may
+    evict it before the response is encoded.
+
+    Args:
+        cache_key: Hash of the LaTeX source
+        dest_file: Where to copy the cached PDF
+
+    Returns:
+        True if the PDF was copied, False on a cache miss
+    """
+    cached_pdf = os.path.join(PDF_CACHE_DIR, f"{cache_key}.pdf")
+    try:
+        # Touch the entry so eviction keeps recently used PDFs
+        os.utime(cached_pdf)
+        shutil.copyfile(cached_pdf, dest_file)
+    except OSError:
+        # Missing or evicted meanwhile, compile it again without a partial copy lying around
+        with suppress(OSError):
+            os.remove(dest_file)
+        return False
+    return True
+
+def _store_cached_pdf(cache_key: str, pdf_file: str):
+    """
+    Copy a freshly compiled PDF into the cache and evict the oldest entries
+
+    Args:
+        cache_key: Hash of the LaTeX source
+        pdf_file: Compiled PDF to cache
+    """
+    try:
+        os.makedirs(PDF_CACHE_DIR, exist_ok=True)
+        cached_pdf = os.path.join(PDF_CACHE_DIR, f"{cache_key}.pdf")
+        # Copy then rename so concurrent readers never see a partial file
+        tmp_file = f"{cached_pdf}.{os.getpid()}.tmp"
+        shutil.copyfile(pdf_file, tmp_file)
+        os.replace(tmp_file, cached_pdf)
+
+        entries = [entry for entry in os.scandir(PDF_CACHE_DIR) if entry.name.endswith(".pdf")]
+        if len(entries) > PDF_CACHE_MAX_ENTRIES:
+            entries.sort(key=lambda entry: entry.stat().st_mtime)
+            for entry in entries[:len(entries) - PDF_CACHE_MAX_ENTRIES]:
+                os.remove(entry.path)
+    except OSError as e:
+        print(f"Could not cache compiled PDF: {e}")
+
 @app.post("/linkedin/add-experience")
 async def add_experience_to_linkedin(request: LinkedInExperienceRequest):
     """
@@ -116,10 +229,122 @@ async def add_experience_to_simplify(request: SimplifyExperienceRequest):
             detail=f"Error adding experience to Simplify: {str(e)}"
         )
 
+@app.post("/resume/export")
+async def export_resume(request: ResumeExportRequest):
+    """
+    Export the resume from Convex as PDF, LaTeX or JSON
+
+    Args:
+        format: 'pdf', 'latex' or 'json' (default: 'pdf')
+        filename: Base name of the exported file, without extension
+        selectedExperienceIds: Convex IDs of experiences to include (default: all)
+        selectedProjectIds: Convex IDs of projects to include (default: all)
+        settings: Font size (pt), margins (cm) and line spacing for PDF/LaTeX output
+
+    Returns:
+        Success status, filename, mime type and base64 encoded file content
+    """
+    if request.format not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported export format: {request.format}"
+        )
+
+    extension, mime_type = EXPORT_FORMATS[request.format]
+    filename = os.path.basename(request.filename) or "resume"
+    message = f"Resume exported as {request.format.upper()}"
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if request.format == "json":
+            output_file = os.path.join(temp_dir, f"{filename}.json")
+            # Downloaded by the user, so keep it readable
+            await run_in_threadpool(export_resume_to_json, output_file, True)
+        else:
+            latex_file = os.path.join(temp_dir, f"{filename}.tex")
+            settings = request.settings
+            if not await run_in_threadpool(
+                export_to_latex, latex_file, settings.fontSize, settings.margins, settings.lineSpacing,
+                selected_experience_ids=request.selectedExperienceIds,
+                selected_project_ids=request.selectedProjectIds
+            ):
+                raise HTTPException(
+                    status_code=500,
+                    detail="Failed to generate LaTeX resume"
+                )
+            output_file = latex_file
+
+            if request.format == "pdf":
+                # Reuse a previous compilation of identical LaTeX source
+                cache_key = await run_in_threadpool(_hash_file, latex_file)
+                pdf_file = os.path.join(temp_dir, f"{filename}.pdf")
+
+                if await run_in_threadpool(_get_cached_pdf, cache_key, pdf_file):
+                    output_file = pdf_file
+                else:
+                    try:
+                        # Run twice so references and page layout settle
+                        for _ in range(2):
+                            proc = await asyncio.create_subprocess_exec(
+                                "pdflatex", "-interaction=nonstopmode", "-output-directory", temp_dir, latex_file,
+                                stdout=asyncio.subprocess.PIPE,
+                                stderr=asyncio.subprocess.PIPE
+                            )
+                            try:
+                                stdout, _ = await asyncio.wait_for(proc.communicate(), PDFLATEX_TIMEOUT)
+                            except asyncio.TimeoutError:
+                                proc.kill()
+                                await proc.wait()
+                                raise HTTPException(status_code=500, detail="PDF generation timed out")
+                    except FileNotFoundError:
+                        # pdflatex is not installed, fall back to the LaTeX source
+                        extension, mime_type = EXPORT_FORMATS["latex"]
+                        message = "pdflatex not found, exported LaTeX source instead"
+                    else:
+                        output_file = pdf_file
+                        if not os.path.exists(output_file):
+                            return {
+                                "success": False,
+                                "message": "PDF compilation failed",
+                                "error_details": stdout.decode(errors="replace")[-2000:]
+                            }
+                        await run_in_threadpool(_store_cached_pdf, cache_key, output_file)
+
+        content = await run_in_threadpool(_encode_file_b64, output_file)
+
+    # Return the response directly so FastAPI skips walking the base64 payload
+    return ORJSONResponse({
+        "success": True,
+        "message": message,
+        "filename": f"{filename}.{extension}",
+        "content": content,
+        "mime_type": mime_type
+    })
+
+@app.get("/resume/preview")
+async def preview_resume():
+    """
+    Get the full resume data from Convex for previewing
+
+    Returns:
+        Success status and resume data (header, education, experience, projects)
+    """
+    try:
+        # get_full_resume already caches for RESUME_CACHE_TTL seconds
+        resume_data = await run_in_threadpool(get_full_resume)
+
+        # Return the response directly so FastAPI skips re-encoding the resume dict
+        return ORJSONResponse({"success": True, "data": resume_data})
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error fetching resume data: {str(e)}"
+        )
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy", "message": "Resume Social Media API is running"}
+    return ORJSONResponse({"status": "healthy", "message": "Resume Social Media API is running"})
 
 @app.get("/")
 async def root():
@@ -129,10 +354,23 @@ async def root():
         "endpoints": {
             "/linkedin/add-experience": "POST - Add experience to LinkedIn",
             "/simplify/add-experience": "POST - Add experience to Simplify",
+            "/resume/export": "POST - Export resume as PDF, LaTeX or JSON",
+            "/resume/preview": "GET - Get resume data for previewing",
             "/health": "GET - Health check"
         }
     }
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("api:app", host="127.0.0.1", port=8000, reload=True)
\ No newline at end of file
+    # Auto-reload only works with a single worker, so it is opt-in for development
+    reload = os.getenv("API_RELOAD", "").lower() in ("1", "true")
+    uvicorn.run(
+        "api:app",
+        host="127.0.0.1",
+        port=8000,
+        # Picks uvloop/httptools when installed, and the stdlib fallbacks elsewhere (e.g. Windows)
+        loop="auto",
+        http="auto",
+        workers=1 if reload else max(2, (os.cpu_count() or 2) // 2),
+        reload=reload
+    )
\ No newline at end of file
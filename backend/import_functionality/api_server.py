@@ -1,15 +1,20 @@
 """
-Flask API server for resume parsing
+FastAPI server for resume parsing
 This server provides an HTTP endpoint to parse resumes using the resume_parser.py module
 """
 
+import asyncio
+import logging
 import os
-import json
-import base64
-import tempfile
+import httpx
+import pybase64
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
 from pathlib import Path
-from flask import Flask, request, jsonify
-from flask_cors import CORS
+from fastapi import FastAPI, Request, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from resume_parser import ResumeParser
 from dotenv import load_dotenv
 
@@ -17,25 +22,94 @@ from dotenv import load_dotenv
 env_path = Path(__file__).parent.parent / '.env'
 load_dotenv(env_path)
 
-app = Flask(__name__)
-CORS(app)  # Enable CORS for all routes
+logger = logging.getLogger("resume-parser-api")
+
+# PDF text extraction is CPU-bound pure Python, so run it in worker processes
+# to keep it from holding the GIL while other requests wait on Claude.
+# Created in lifespan so only the serving process (not the reloader) spawns workers.
+pdf_executor = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global pdf_executor
+    pdf_executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+    try:
+        yield
+    finally:
+        await http_client.aclose()
+        pdf_executor.shutdown(wait=False)
+
+
+app = FastAPI(title="Resume Parser API", version="1.0.0", default_response_class=ORJSONResponse, lifespan=lifespan)
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],  # Enable CORS for all routes
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+# Reject uploads over 25 MB
+MAX_UPLOAD_BYTES = 25 * 1024 * 1024
+
+# Pooled async HTTP client so repeated downloads from the same host reuse connections
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+http_client = httpx.AsyncClient(
+    http2=True,
+    timeout=30,
+    follow_redirects=True,
+    limits=httpx.Limits(max_connections=50, max_keepalive_connections=10)
+)
 
 # Initialize the resume parser
 parser = ResumeParser()
 
 
-@app.route('/health', methods=['GET'])
-def health_check():
+def error_response(error: str, status_code: int) -> ORJSONResponse:
+    return ORJSONResponse({'success': False, 'error': error}, status_code=status_code)
+
+
+def resume_extension(file_name: str, file_type: str):
+    """Map an uploaded file's name and mime type to a supported extension, or None."""
+    if file_name.endswith('.pdf') or 'pdf' in file_type:
+        return '.pdf'
+    if file_name.endswith('.docx') or 'word' in file_type:
+        return '.docx'
+    return None
+
+
+async def parse_resume_bytes(file_bytes: bytes, extension: str):
+    """Extract text from in-memory resume content and parse it with the shared parser."""
+    if extension == '.pdf':
+        loop = asyncio.get_running_loop()
+        resume_text = await loop.run_in_executor(pdf_executor, ResumeParser.extract_text_from_pdf_bytes, file_bytes)
+    else:
+        resume_text = await run_in_threadpool(parser.extract_text_from_bytes, file_bytes, extension)
+
+    parsed_data = await parser.parse_text(resume_text)
+
+    return {
+        'success': True,
+        'data': parsed_data,
+        'message': 'Resume parsed successfully'
+    }
+
+
+@app.get('/health')
+async def health_check():
     """Health check endpoint"""
-    return jsonify({'status': 'healthy', 'service': 'resume-parser-api'})
+    return {'status': 'healthy', 'service': 'resume-parser-api'}
 
 
-@app.route('/parse-resume', methods=['POST'])
-def parse_resume():
+@app.post('/parse-resume')
+async def parse_resume(request: Request):
     """
-    Parse a resume from base64 encoded file content
+    Parse an uploaded resume
 
-    Expected JSON payload:
+    Preferred: multipart/form-data with the resume in a "file" field.
+    The upload is parsed in memory, so no base64 layer is needed.
+
+    Deprecated: JSON payload with base64 encoded file content
     {
         "fileContent": "base64_encoded_string",
         "fileName": "resume.pdf",
@@ -43,68 +117,54 @@ def parse_resume():
     }
     """
     try:
-        data = request.json
-
-        if not data or 'fileContent' not in data:
-            return jsonify({
-                'success': False,
-                'error': 'Missing fileContent in request'
-            }), 400
-
-        file_content = data['fileContent']
-        file_name = data.get('fileName', 'resume.pdf')
-        file_type = data.get('fileType', '')
-
-        # Determine file extension
-        if file_name.endswith('.pdf') or 'pdf' in file_type:
-            extension = '.pdf'
-        elif file_name.endswith('.docx') or 'word' in file_type:
-            extension = '.docx'
+        if request.headers.get('content-type', '').startswith('multipart/form-data'):
+            form = await request.form()
+            upload = form.get('file')
+            if not isinstance(upload, UploadFile):
+                return error_response('Missing file upload in request', 400)
+
+            extension = resume_extension(upload.filename or '', upload.content_type or '')
+            if not extension:
+                return error_response('Unsupported file type. Only PDF and DOCX are supported.', 400)
+
+            # Read the spooled upload into memory, enforcing the size limit
+            chunks = []
+            size = 0
+            while chunk := await upload.read(DOWNLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > MAX_UPLOAD_BYTES:
+                    return error_response('Uploaded file is larger than 25 MB', 413)
+                chunks.append(chunk)
+            file_bytes = b''.join(chunks)
         else:
-            return jsonify({
-                'success': False,
-                'error': 'Unsupported file type. Only PDF and DOCX are supported.'
-            }), 400
+            try:
+                data = await request.json()
+            except ValueError:
+                data = None
 
-        # Decode base64 content
-        try:
-            file_bytes = base64.b64decode(file_content)
-        except Exception as e:
-            return jsonify({
-                'success': False,
-                'error': f'Invalid base64 encoding: {str(e)}'
-            }), 400
-
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(suffix=extension, delete=False) as tmp_file:
-            tmp_file.write(file_bytes)
-            tmp_file_path = tmp_file.name
+            if not data or 'fileContent' not in data:
+                return error_response('Missing file upload or fileContent in request', 400)
 
-        try:
-            # Parse the resume
-            parsed_data = parser.parse_resume(tmp_file_path)
+            file_content = data['fileContent']
+            extension = resume_extension(data.get('fileName', 'resume.pdf'), data.get('fileType', ''))
+            if not extension:
+                return error_response('Unsupported file type. Only PDF and DOCX are supported.', 400)
 
-            return jsonify({
-                'success': True,
-                'data': parsed_data,
-                'message': 'Resume parsed successfully'
-            })
+            # Decode base64 content
+            try:
+                file_bytes = pybase64.b64decode(file_content, validate=False)
+            except Exception as e:
+                return error_response(f'Invalid base64 encoding: {str(e)}', 400)
 
-        finally:
-            # Clean up temporary file
-            if os.path.exists(tmp_file_path):
-                os.remove(tmp_file_path)
+        return await parse_resume_bytes(file_bytes, extension)
 
     except Exception as e:
-        app.logger.error(f"Error parsing resume: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        logger.error(f"Error parsing resume: {str(e)}")
+        return error_response(str(e), 500)
 
 
-@app.route('/parse-resume-url', methods=['POST'])
-def parse_resume_url():
+@app.post('/parse-resume-url')
+async def parse_resume_url(request: Request):
     """
     Parse a resume from a URL (alternative endpoint)
 
@@ -114,75 +174,55 @@ def parse_resume_url():
     }
     """
     try:
-        data = request.json
+        try:
+            data = await request.json()
+        except ValueError:
+            data = None
 
         if not data or 'url' not in data:
-            return jsonify({
-                'success': False,
-                'error': 'Missing url in request'
-            }), 400
+            return error_response('Missing url in request', 400)
 
         url = data['url']
 
         # Download file from URL
-        import requests
-        response = requests.get(url, timeout=30)
-
-        if response.status_code != 200:
-            return jsonify({
-                'success': False,
-                'error': f'Failed to download file from URL: {response.status_code}'
-            }), 400
-
-        # Determine extension from URL or content-type
-        if url.endswith('.pdf') or 'pdf' in response.headers.get('content-type', ''):
-            extension = '.pdf'
-        elif url.endswith('.docx') or 'word' in response.headers.get('content-type', ''):
-            extension = '.docx'
-        else:
-            return jsonify({
-                'success': False,
-                'error': 'Could not determine file type from URL'
-            }), 400
-
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(suffix=extension, delete=False) as tmp_file:
-            tmp_file.write(response.content)
-            tmp_file_path = tmp_file.name
-
-        try:
-            # Parse the resume
-            parsed_data = parser.parse_resume(tmp_file_path)
-
-            return jsonify({
-                'success': True,
-                'data': parsed_data,
-                'message': 'Resume parsed successfully'
-            })
-
-        finally:
-            # Clean up temporary file
-            if os.path.exists(tmp_file_path):
-                os.remove(tmp_file_path)
+        async with http_client.stream('GET', url) as response:
+            if response.status_code != 200:
+                return error_response(f'Failed to download file from URL: {response.status_code}', 400)
+
+            # Determine extension from URL or content-type
+            extension = resume_extension(url, response.headers.get('content-type', ''))
+            if not extension:
+                return error_response('Could not determine file type from URL', 400)
+
+            chunks = []
+            size = 0
+            async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > MAX_UPLOAD_BYTES:
+                    return error_response('Downloaded file is larger than 25 MB', 413)
+                chunks.append(chunk)
+            file_bytes = b''.join(chunks)
+
+        return await parse_resume_bytes(file_bytes, extension)
 
     except Exception as e:
-        app.logger.error(f"Error parsing resume from URL: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        logger.error(f"Error parsing resume from URL: {str(e)}")
+        return error_response(str(e), 500)
 
 
 if __name__ == '__main__':
+    import uvicorn
+
     # Run the server (default to 5001 to avoid conflict with macOS AirPlay)
     port = int(os.environ.get('PORT', 5001))
-    debug = os.environ.get('FLASK_ENV') == 'development'
+    reload = os.getenv("API_RELOAD", "").lower() in ("1", "true")
 
     print(f"Starting Resume Parser API server on port {port}")
-    print(f"Debug mode: {debug}")
+    print(f"Auto-reload: {reload}")
+    print(f"Base64 backend: pybase64 {pybase64.get_version()}")
     print("\nEndpoints:")
     print(f"  GET  http://localhost:{port}/health")
     print(f"  POST http://localhost:{port}/parse-resume")
     print(f"  POST http://localhost:{port}/parse-resume-url")
 
-    app.run(host='0.0.0.0', port=port, debug=debug)
\ No newline at end of file
+    uvicorn.run("api_server:app", host='0.0.0.0', port=port, reload=reload)
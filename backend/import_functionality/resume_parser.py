@@ -1,11 +1,16 @@
-import json
+import asyncio
+import io
 import os
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import IO, Dict, Any, Optional, Union
 from datetime import datetime
 
 import anthropic
+import httpx
+import orjson
 from PyPDF2 import PdfReader
 from docx import Document
 from dotenv import load_dotenv
@@ -14,6 +19,44 @@ from dotenv import load_dotenv
 env_path = Path(__file__).parent.parent / '.env'
 load_dotenv(env_path)
 
+# Outermost {...} span, used to recover JSON wrapped in extra text by the model
+JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+# Default values for fields Claude leaves out; skills and coursework are filled separately
+HEADER_DEFAULTS = {"email": "", "github": "", "lastUpdated": "", "linkedin": "", "location": "",
+                   "name": "", "phone": "", "tagline": "", "website": ""}
+EDUCATION_DEFAULTS = {"degree": "", "endDate": "", "gpa": "", "major": "", "startDate": "", "university": ""}
+EXPERIENCE_DEFAULTS = {"description": "", "endDate": "", "position": "", "startDate": "", "title": "", "url": ""}
+PROJECT_DEFAULTS = {"award": "", "date": "", "description": "", "endDate": "", "event": "",
+                    "organization": "", "title": "", "url": ""}
+
+TEMPLATE_PATH = Path(__file__).parent.parent / "data" / "import_template.json"
+
+
+@lru_cache(maxsize=1)
+def _read_template(path: str, mtime: float) -> Dict[str, Any]:
+    """Read and parse the template; mtime is part of the cache key so edits are picked up."""
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+def load_template() -> Dict[str, Any]:
+    """Return the import template, re-reading it only when the file changes."""
+    return _read_template(str(TEMPLATE_PATH), os.path.getmtime(TEMPLATE_PATH))
+
+
+@lru_cache(maxsize=None)
+def get_anthropic_client(api_key: str) -> anthropic.AsyncAnthropic:
+    """Return a shared async client per API key so parses reuse pooled HTTP/2 connections."""
+    return anthropic.AsyncAnthropic(
+        api_key=api_key,
+        http_client=httpx.AsyncClient(
+            http2=True,
+            timeout=60,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+        )
+    )
+
 
 class ResumeParser:
     def __init__(self, api_key: Optional[str] = None):
@@ -27,44 +70,64 @@ class ResumeParser:
         if not self.api_key:
             raise ValueError("Anthropic API key is required. Set ANTHROPIC_API_KEY environment variable or pass it as parameter.")
 
-        self.client = anthropic.Anthropic(api_key=self.api_key)
+        self.client = get_anthropic_client(self.api_key)
 
         # Load the template structure
-        template_path = Path(__file__).parent.parent / "data" / "import_template.json"
-        with open(template_path, 'r') as f:
-            self.template = json.load(f)
+        self.template = load_template()
 
-    def extract_text_from_pdf(self, file_path: str) -> str:
+    @staticmethod
+    def _extract_pdf_text(source: Union[str, bytes]) -> str:
+        """Extract text from a PDF given its path or its raw bytes."""
+        reader = PdfReader(io.BytesIO(source) if isinstance(source, bytes) else source)
+        return "\n".join(page.extract_text() or "" for page in reader.pages).strip()
+
+    @staticmethod
+    def extract_text_from_pdf(file_path: str) -> str:
         """Extract text from a PDF file."""
         try:
-            reader = PdfReader(file_path)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
-            return text.strip()
+            return ResumeParser._extract_pdf_text(file_path)
+        except Exception as e:
+            raise Exception(f"Error reading PDF file: {str(e)}")
+
+    @staticmethod
+    def extract_text_from_pdf_bytes(data: bytes) -> str:
+        """Extract text from PDF content held in memory."""
+        try:
+            return ResumeParser._extract_pdf_text(data)
         except Exception as e:
             raise Exception(f"Error reading PDF file: {str(e)}")
 
-    def extract_text_from_docx(self, file_path: str) -> str:
-        """Extract text from a DOCX file."""
+    def extract_text_from_docx(self, file: Union[str, IO[bytes]]) -> str:
+        """Extract text from a DOCX file path or file-like object."""
         try:
-            doc = Document(file_path)
-            text = []
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    text.append(paragraph.text)
+            doc = Document(file)
+            # .text rebuilds the string from its runs on every access, so read it once
+            text = [t for t in (paragraph.text for paragraph in doc.paragraphs) if t.strip()]
 
             # Also extract text from tables
             for table in doc.tables:
                 for row in table.rows:
-                    for cell in row.cells:
-                        if cell.text.strip():
-                            text.append(cell.text)
+                    text.extend(t for t in (cell.text for cell in row.cells) if t.strip())
 
             return "\n".join(text)
         except Exception as e:
             raise Exception(f"Error reading DOCX file: {str(e)}")
 
+    def extract_text_from_docx_bytes(self, data: bytes) -> str:
+        """Extract text from DOCX content held in memory."""
+        return self.extract_text_from_docx(io.BytesIO(data))
+
+    def extract_text_from_bytes(self, data: bytes, extension: str) -> str:
+        """Extract text from in-memory PDF or DOCX content, dispatching on the file extension."""
+        extension = extension.lower()
+
+        if extension == '.pdf':
+            return self.extract_text_from_pdf_bytes(data)
+        elif extension in ['.docx', '.doc']:
+            return self.extract_text_from_docx_bytes(data)
+        else:
+            raise ValueError(f"Unsupported file type: {extension}. Only PDF and DOCX files are supported.")
+
     def extract_text(self, file_path: str) -> str:
         """Extract text from either PDF or DOCX file."""
         file_path = Path(file_path)
@@ -81,7 +144,7 @@ class ResumeParser:
         else:
             raise ValueError(f"Unsupported file type: {extension}. Only PDF and DOCX files are supported.")
 
-    def parse_with_anthropic(self, resume_text: str) -> Dict[str, Any]:
+    async def parse_with_anthropic(self, resume_text: str) -> Dict[str, Any]:
         """
         Use Anthropic's Claude API to parse resume text into the structured format.
         """
@@ -156,14 +219,18 @@ Guidelines:
         user_prompt = f"Parse the following resume and extract information into the JSON format:\n\n{resume_text}"
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.messages.create(
                 model="claude-3-5-sonnet-20241022",
                 max_tokens=4000,
                 temperature=0,
-                system=system_prompt,
+                # The system prompt is identical on every call, so mark it as a cacheable prefix
+                system=[
+                    {"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}
+                ],
                 messages=[
                     {"role": "user", "content": user_prompt}
-                ]
+                ],
+                extra_headers={"anthropic-beta": "prompt-caching-2024-07-31"}
             )
 
             # Extract the JSON from the response
@@ -171,14 +238,13 @@ Guidelines:
 
             # Try to parse the JSON
             try:
-                parsed_data = json.loads(response_text)
+                parsed_data = orjson.loads(response_text)
                 return self.validate_and_clean_data(parsed_data)
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 # If direct parsing fails, try to extract JSON from the response
-                import re
-                json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
+                json_match = JSON_OBJECT_RE.search(response_text)
                 if json_match:
-                    parsed_data = json.loads(json_match.group())
+                    parsed_data = orjson.loads(json_match.group())
                     return self.validate_and_clean_data(parsed_data)
                 else:
                     raise ValueError("Could not extract valid JSON from API response")
@@ -190,63 +256,27 @@ Guidelines:
         """
         Validate and clean the parsed data to match the expected format.
         """
-        # Ensure all required top-level keys exist
-        if 'header' not in data:
-            data['header'] = {}
-        if 'education' not in data:
-            data['education'] = {}
-        if 'experience' not in data:
-            data['experience'] = []
-        if 'projects' not in data:
-            data['projects'] = []
-
-        # Clean header
-        header_fields = ['email', 'github', 'lastUpdated', 'linkedin', 'location',
-                        'name', 'phone', 'skills', 'tagline', 'website']
-        for field in header_fields:
-            if field not in data['header']:
-                if field == 'skills':
-                    data['header']['skills'] = {}
-                else:
-                    data['header'][field] = ""
-
-        # Ensure skills is properly formatted as a dict
-        if not isinstance(data['header']['skills'], dict):
-            data['header']['skills'] = {}
-
-        # Clean education
-        edu_fields = ['coursework', 'degree', 'endDate', 'gpa', 'major', 'startDate', 'university']
-        for field in edu_fields:
-            if field not in data['education']:
-                if field == 'coursework':
-                    data['education'][field] = []
-                else:
-                    data['education'][field] = ""
-
-        # Ensure coursework is a list
-        if not isinstance(data['education'].get('coursework'), list):
-            data['education']['coursework'] = []
-
-        # Clean experience entries
-        exp_fields = ['description', 'endDate', 'position', 'startDate', 'title', 'url']
-        for i, exp in enumerate(data['experience']):
-            for field in exp_fields:
-                if field not in exp:
-                    data['experience'][i][field] = ""
-
-        # Clean project entries
-        proj_fields = ['award', 'date', 'description', 'endDate', 'event', 'organization', 'title', 'url']
-        for i, proj in enumerate(data['projects']):
-            for field in proj_fields:
-                if field not in proj:
-                    data['projects'][i][field] = ""
+        # Fill missing fields by merging each entity over its defaults
+        header = {**HEADER_DEFAULTS, **data.get('header', {})}
+        education = {**EDUCATION_DEFAULTS, **data.get('education', {})}
+
+        # Ensure skills is a dict and coursework is a list (fresh objects, never shared defaults)
+        if not isinstance(header.get('skills'), dict):
+            header['skills'] = {}
+        if not isinstance(education.get('coursework'), list):
+            education['coursework'] = []
+
+        data['header'] = header
+        data['education'] = education
+        data['experience'] = [{**EXPERIENCE_DEFAULTS, **exp} for exp in data.get('experience', [])]
+        data['projects'] = [{**PROJECT_DEFAULTS, **proj} for proj in data.get('projects', [])]
 
         # Set lastUpdated to current date
         data['header']['lastUpdated'] = datetime.now().strftime("%m/%Y")
 
         return data
 
-    def parse_resume(self, file_path: str) -> Dict[str, Any]:
+    async def parse_resume(self, file_path: str) -> Dict[str, Any]:
         """
         Main method to parse a resume file and return structured data.
 
@@ -259,11 +289,23 @@ Guidelines:
         # Extract text from file
         resume_text = self.extract_text(file_path)
 
+        return await self.parse_text(resume_text)
+
+    async def parse_text(self, resume_text: str) -> Dict[str, Any]:
+        """
+        Parse already extracted resume text into structured data.
+
+        Args:
+            resume_text: Plain text extracted from a resume file
+
+        Returns:
+            Dictionary containing parsed resume data in the template format
+        """
         if not resume_text or len(resume_text.strip()) < 50:
             raise ValueError("Could not extract sufficient text from the resume file")
 
         # Parse with Anthropic API
-        parsed_data = self.parse_with_anthropic(resume_text)
+        parsed_data = await self.parse_with_anthropic(resume_text)
 
         return parsed_data
 
@@ -285,8 +327,9 @@ Guidelines:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        # orjson writes UTF-8 bytes directly, skipping the per-character \uXXXX escaping
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
         return str(output_path)
 
@@ -310,7 +353,7 @@ def main():
         print(f"Parsing resume: {resume_file}")
 
         # Parse the resume
-        parsed_data = parser.parse_resume(resume_file)
+        parsed_data = asyncio.run(parser.parse_resume(resume_file))
 
         # Save to file
         saved_path = parser.save_to_file(parsed_data, output_file)
@@ -0,0 +1,54 @@
+# cython: language_level=3
+"""
+Compiled LaTeX escaping used by utils.escape_latex when the extension is built
+"""
+
+# Replacement for each ASCII codepoint, or None when the character is emitted as-is
+cdef list REPL = [None] * 128
+REPL[ord('&')] = r'\&'
+REPL[ord('%')] = r'\%'
+REPL[ord('$')] = r'\$'
+REPL[ord('#')] = r'\#'
+REPL[ord('_')] = r'\_'
+REPL[ord('{')] = r'\{'
+REPL[ord('}')] = r'\}'
+REPL[ord('~')] = r'\textasciitilde{}'
+REPL[ord('^')] = r'\textasciicircum{}'
+REPL[ord('\\')] = r'\textbackslash{}'
+
+# C-level flags mirroring REPL so the scan loop only touches Python objects on a hit
+cdef unsigned char SPECIAL[128]
+cdef Py_ssize_t _j
+for _j in range(128):
+    SPECIAL[_j] = REPL[_j] is not None
+
+
+cpdef str escape_latex(str text):
+    """
+    Escape special LaTeX characters in text
+    """
+    if not text:
+        return ""
+
+    cdef Py_ssize_t i
+    cdef Py_ssize_t start = 0
+    cdef Py_ssize_t n = len(text)
+    cdef Py_UCS4 ch
+    cdef list parts = []
+
+    for i in range(n):
+        ch = text[i]
+        if ch < 128 and SPECIAL[<Py_ssize_t>ch]:
+            if i > start:
+                parts.append(text[start:i])
+            parts.append(REPL[<Py_ssize_t>ch])
+            start = i + 1
+
+    # Nothing to escape, hand back the original string without copying
+    if start == 0:
+        return text
+
+    if start < n:
+        parts.append(text[start:])
+
+    return "".join(parts)
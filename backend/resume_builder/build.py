@@ -0,0 +1,46 @@
+import hashlib
+import os
+import shutil
+import subprocess
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
+
+def build_pdf(tex_file: str = os.path.join(DATA_DIR, "resume.tex"), output_dir: str = DATA_DIR) -> str:
+    """
+    Compile a LaTeX resume to PDF, skipping the build when the source is unchanged
+
+    Args:
+        tex_file: LaTeX source to compile
+        output_dir: Directory the PDF is written to
+
+    Returns:
+        Path to the compiled PDF
+    """
+    with open(tex_file, 'rb') as f:
+        digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+    pdf_file = os.path.join(output_dir, os.path.splitext(os.path.basename(tex_file))[0] + ".pdf")
+    hash_file = pdf_file + ".blake2b"
+
+    # Reuse the existing PDF if it was built from identical source
+    if os.path.exists(pdf_file) and os.path.exists(hash_file):
+        with open(hash_file, 'r') as f:
+            if f.read().strip() == digest:
+                print(f"{tex_file} unchanged, reusing {pdf_file}")
+                return pdf_file
+
+    if shutil.which("tectonic"):
+        subprocess.run(["tectonic", "-X", "compile", tex_file, "--keep-intermediates", "--outdir", output_dir], check=True)
+    else:
+        # Run twice so references and page layout settle
+        for _ in range(2):
+            subprocess.run(["pdflatex", "-interaction=nonstopmode", "-output-directory", output_dir, tex_file], check=True)
+
+    with open(hash_file, 'w') as f:
+        f.write(digest)
+
+    print(f"PDF resume built at {pdf_file}")
+    return pdf_file
+
+if __name__ == "__main__":
+    build_pdf()
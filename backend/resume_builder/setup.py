@@ -0,0 +1,13 @@
+"""
+Build the optional compiled LaTeX escaper in place:
+
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="resume-builder-extensions",
+    ext_modules=cythonize("_latex_escape.pyx", language_level=3),
+)
@@ -0,0 +1,790 @@
+import asyncio
+import os
+import re
+import time
+import orjson
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Any, TextIO
+from dotenv import load_dotenv
+
+try:
+    from . import _latex_escape
+except ImportError:
+    # Compiled escaper not built (see setup.py), use the pure Python version
+    _latex_escape = None
+
+# Load environment variables from .env.local file in parent directory
+load_dotenv(os.path.join(os.path.dirname(__file__), "..", "..", ".env.local"))
+
+# backend/data, where the CLI below writes its exports
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+# Get Convex URL from environment
+CONVEX_URL = os.getenv('VITE_CONVEX_URL', 'https://calculating-toad-355.convex.cloud')
+
+# Query results are reused for this many seconds so back-to-back callers
+# (export, filter, summary) share one Convex round trip. Set to 0 to always refetch.
+RESUME_CACHE_TTL = float(os.getenv('RESUME_CACHE_TTL', '2.0'))
+
+# Query name -> (fetched_at, result)
+_query_cache: Dict[str, tuple] = {}
+
+# LaTeX special characters and their escaped forms, applied in a single pass
+LATEX_ESCAPE_TABLE = str.maketrans({
+    '&': r'\&',
+    '%': r'\%',
+    '$': r'\$',
+    '#': r'\#',
+    '_': r'\_',
+    '{': r'\{',
+    '}': r'\}',
+    '~': r'\textasciitilde{}',
+    '^': r'\textasciicircum{}',
+    '\\': r'\textbackslash{}',
+})
+
+# Sentence boundary in a description string: a period followed by whitespace or
+# the end of the text, so periods inside "Node.js" or "3.5x" don't split
+SENTENCE_END_RE = re.compile(r'\.(?:\s+|$)')
+
+# Any character that needs escaping, used to skip translate() for clean text
+LATEX_SPECIAL_RE = re.compile(r'[\\&%$#_{}~^]')
+
+# LaTeX preamble (document setup, packages, custom commands), filled in once per
+# export with str.format. Literal braces are doubled.
+LATEX_PREAMBLE_TEMPLATE = r"""\documentclass[11pt, letterpaper]{{article}}
+
+% Packages:
+\usepackage[
+    ignoreheadfoot, % set margins without considering header and footer
+    top=1.0 cm, % seperation between body and page edge from the top
+    bottom=0.5 cm, % seperation between body and page edge from the bottom
+    left={margins} cm, % seperation between body and page edge from the left
+    right={margins} cm, % seperation between body and page edge from the right
+    footskip=1.0 cm, % seperation between body and footer
+    % showframe % for debugging
+]{{geometry}} % for adjusting page geometry
+\usepackage{{titlesec}} % for customizing section titles
+\usepackage{{tabularx}} % for making tables with fixed width columns
+\usepackage{{array}} % tabularx requires this
+\usepackage[dvipsnames]{{xcolor}} % for coloring text
+\definecolor{{primaryColor}}{{RGB}}{{0, 0, 0}} % define primary color
+\usepackage{{enumitem}} % for customizing lists
+\usepackage{{fontawesome5}} % for using icons
+\usepackage{{amsmath}} % for math
+\usepackage[
+    pdftitle={{{title}'s CV}},
+    pdfauthor={{{author}}},
+    pdfcreator={{LaTeX with RenderCV}},
+    colorlinks=true,
+    urlcolor=primaryColor
+]{{hyperref}} % for links, metadata and bookmarks
+\usepackage[pscoord]{{eso-pic}} % for floating text on the page
+\usepackage{{calc}} % for calculating lengths
+\usepackage{{bookmark}} % for bookmarks
+\usepackage{{lastpage}} % for getting the total number of pages
+\usepackage{{changepage}} % for one column entries (adjustwidth environment)
+\usepackage{{paracol}} % for two and three column entries
+\usepackage{{ifthen}} % for conditional statements
+\usepackage{{needspace}} % for avoiding page brake right after the section title
+\usepackage{{iftex}} % check if engine is pdflatex, xetex or luatex
+
+% Ensure that generate pdf is machine readable/ATS parsable:
+\ifPDFTeX
+    \input{{glyphtounicode}}
+    \pdfgentounicode=1
+    \usepackage[T1]{{fontenc}}
+    \usepackage[utf8]{{inputenc}}
+    \usepackage{{lmodern}}
+\fi
+
+\usepackage{{charter}}
+
+% Some settings:
+\raggedright
+\AtBeginEnvironment{{adjustwidth}}{{\partopsep0pt}} % remove space before adjustwidth environment
+\pagestyle{{empty}} % no header or footer
+\setcounter{{secnumdepth}}{{0}} % no section numbering
+\setlength{{\parindent}}{{0pt}} % no indentation
+\setlength{{\topskip}}{{0pt}} % no top skip
+\setlength{{\columnsep}}{{0.15cm}} % set column seperation
+\pagenumbering{{gobble}} % no page numbering
+
+\titleformat{{\section}}{{\needspace{{4\baselineskip}}\bfseries\large}}{{}}{{0pt}}{{}}[\vspace{{1pt}}\titlerule]
+
+\titlespacing{{\section}}{{
+    % left space:
+    -1pt
+}}{{
+    % top space:
+    0.3 cm
+}}{{
+    % bottom space:
+    0.2 cm
+}} % section title spacing
+
+\renewcommand\labelitemi{{$\vcenter{{\hbox{{\small$\bullet$}}}}$}} % custom bullet points
+\newenvironment{{highlights}}{{
+    \begin{{itemize}}[
+        topsep=0.10 cm,
+        parsep=0.10 cm,
+        partopsep=0pt,
+        itemsep=0pt,
+        leftmargin=0 cm + 10pt
+    ]
+}}{{
+    \end{{itemize}}
+}} % new environment for highlights
+
+
+\newenvironment{{highlightsforbulletentries}}{{
+    \begin{{itemize}}[
+        topsep=0.10 cm,
+        parsep=0.10 cm,
+        partopsep=0pt,
+        itemsep=0pt,
+        leftmargin=10pt
+    ]
+}}{{
+    \end{{itemize}}
+}} % new environment for highlights for bullet entries
+
+\newenvironment{{onecolentry}}{{
+    \begin{{adjustwidth}}{{
+        0 cm + 0.00001 cm
+    }}{{
+        0 cm + 0.00001 cm
+    }}
+}}{{
+    \end{{adjustwidth}}
+}} % new environment for one column entries
+
+\newenvironment{{twocolentry}}[2][]{{
+    \onecolentry
+    \def\secondColumn{{#2}}
+    \setcolumnwidth{{\fill, 4.5 cm}}
+    \begin{{paracol}}{{2}}
+}}{{
+    \switchcolumn \raggedleft \secondColumn
+    \end{{paracol}}
+    \endonecolentry
+}} % new environment for two column entries
+
+\newenvironment{{threecolentry}}[3][]{{
+    \onecolentry
+    \def\thirdColumn{{#3}}
+    \setcolumnwidth{{, \fill, 4.5 cm}}
+    \begin{{paracol}}{{3}}
+    {{\raggedright #2}} \switchcolumn
+}}{{
+    \switchcolumn \raggedleft \thirdColumn
+    \end{{paracol}}
+    \endonecolentry
+}} % new environment for three column entries
+
+\newenvironment{{header}}{{
+    \setlength{{\topsep}}{{0pt}}\par\kern\topsep\centering\linespread{{1.5}}
+}}{{
+    \par\kern\topsep
+}} % new environment for the header
+
+\newcommand{{\placelastupdatedtext}}{{% \placetextbox{{<horizontal pos>}}{{<vertical pos>}}{{<stuff>}}
+  \AddToShipoutPictureFG*{{% Add <stuff> to current page foreground
+    \put(
+        \LenToUnit{{\paperwidth-2 cm-0 cm+0.05cm}},
+        \LenToUnit{{\paperheight-1.0 cm}}
+    ){{\vtop{{{{\null}}\makebox[0pt][c]{{
+        \small\color{{gray}}\textit{{Last updated in September 2024}}\hspace{{\widthof{{Last updated in September 2024}}}}
+    }}}}}}%
+  }}%
+}}%
+
+% save the original href command in a new command:
+\let\hrefWithoutArrow\href
+
+% new command for external links:
+
+\usepackage{{anyfontsize}}   % allows arbitrary font sizes
+
+\AtBeginDocument{{%
+  \fontsize{{{font_size}pt}}{{{baseline_skip}pt}}\selectfont
+}}
+
+\begin{{document}}
+    \newcommand{{\AND}}{{\unskip
+        \cleaders\copy\ANDbox\hskip\wd\ANDbox
+        \ignorespaces
+    }}
+    \newsavebox\ANDbox
+    \sbox\ANDbox{{$|$}}"""
+
+# Experience and project entries, filled in with one str.format call each. Literal braces are doubled.
+EXPERIENCE_ENTRY_TEMPLATE = r"""    \begin{{twocolentry}}{{
+        {dates}
+    }}
+        \textbf{{{title}}}{position}\end{{twocolentry}}
+
+    \vspace{{0.10 cm}}
+    \begin{{onecolentry}}
+        \begin{{highlights}}
+{items}        \end{{highlights}}
+    \end{{onecolentry}}
+"""
+
+EXPERIENCE_SEPARATOR = "\n    \\vspace{0.2 cm}\n\n"
+
+PROJECT_ENTRY_TEMPLATE = r"""        \begin{{twocolentry}}{{
+            {date}
+        }}
+            {title}\end{{twocolentry}}
+        \vspace{{0.10 cm}}
+        \begin{{onecolentry}}
+            \begin{{highlights}}
+{items}            \end{{highlights}}
+        \end{{onecolentry}}
+"""
+
+PROJECT_SEPARATOR = "\n        \\vspace{0.2 cm}\n\n"
+
+# Skill categories in display order: (LaTeX-escaped label, key in header.skills)
+SKILL_CATEGORIES = (
+    ('Languages', 'languages'),
+    ('Web Development', 'web_development'),
+    ('AI/ML', 'ai_ml'),
+    (r'Cloud \& Data', 'cloud_data'),
+    ('Tools', 'tools'),
+)
+
+# Fields kept unescaped by escape_resume because they end up in \href targets
+RAW_FIELDS = frozenset(('email', 'website', 'linkedin', 'github', 'link', 'url'))
+
+# Header contact fields in display order: (field, link prefix, whether the link text drops the URL protocol)
+CONTACT_FIELDS = (
+    ('email', 'mailto:', False),
+    ('website', '', True),
+    ('linkedin', '', True),
+    ('github', '', True),
+)
+
+# Leading protocol/www. and trailing slashes stripped from URLs shown as link text
+URL_DISPLAY_RE = re.compile(r'^(?:https?://)?(?:www\.)?|/+$')
+
+# Separator placed between header contact items
+CONTACT_SEPARATOR = "%\n        \\kern 5.0 pt%\n        \\AND%\n        \\kern 5.0 pt%\n        "
+
+@lru_cache(maxsize=1)
+def _get_client():
+    """
+    Get the shared Convex client, creating it on first use so importing this
+    module (e.g. just for escape_latex) doesn't pull in the Convex SDK
+
+    Returns:
+        The ConvexClient for CONVEX_URL
+    """
+    from convex import ConvexClient
+    return ConvexClient(CONVEX_URL)
+
+def _query(name: str, use_cache: bool = True) -> Any:
+    """
+    Run a resumeFunctions query on the shared Convex client
+
+    Results are cached per query name for RESUME_CACHE_TTL seconds.
+
+    Args:
+        name: Query name inside convex/resumeFunctions.ts
+        use_cache: Set to False to force a fresh fetch from Convex
+
+    Returns:
+        The query result
+    """
+    now = time.monotonic()
+    if use_cache:
+        cached = _query_cache.get(name)
+        if cached is not None and now - cached[0] < RESUME_CACHE_TTL:
+            return cached[1]
+
+    result = _get_client().query(f"resumeFunctions:{name}")
+    _query_cache[name] = (now, result)
+    return result
+
+def get_full_resume(use_cache: bool = True) -> Dict:
+    """
+    Get all resume data (header, education, experience, projects)
+
+    All four sections come back from the single resumeFunctions:getFullResume
+    query, and the result is cached for RESUME_CACHE_TTL seconds.
+
+    Args:
+        use_cache: Set to False to force a fresh fetch from Convex
+
+    Returns:
+        Complete resume data as a dictionary
+    """
+    return _query("getFullResume", use_cache)
+
+def get_filtered_resume(selected_experience_ids: Optional[List[str]] = None,
+                        selected_project_ids: Optional[List[str]] = None,
+                        data: Optional[Dict] = None) -> Dict:
+    """
+    Get all resume data, keeping only the selected experience and project entries
+
+    Args:
+        selected_experience_ids: Convex IDs (_id) of experiences to keep, or None to keep all
+        selected_project_ids: Convex IDs (_id) of projects to keep, or None to keep all
+        data: Already fetched resume data to filter instead of calling get_full_resume
+
+    Returns:
+        Resume data in the same shape as get_full_resume
+    """
+    if data is None:
+        data = get_full_resume()
+    if selected_experience_ids is None and selected_project_ids is None:
+        return data
+
+    # Copy so the cached full resume is left untouched
+    filtered = dict(data)
+
+    # Sets give O(1) membership checks for long selections
+    if selected_experience_ids is not None:
+        experience_ids = set(selected_experience_ids)
+        filtered['experience'] = [exp for exp in data.get('experience') or [] if exp.get('_id') in experience_ids]
+
+    if selected_project_ids is not None:
+        project_ids = set(selected_project_ids)
+        filtered['projects'] = [project for project in data.get('projects') or [] if project.get('_id') in project_ids]
+
+    return filtered
+
+def invalidate_resume_cache():
+    """
+    Drop all cached query results so the next calls refetch from Convex
+    """
+    _query_cache.clear()
+
+def get_header() -> Optional[Dict]:
+    """
+    Get header/personal information
+
+    Returns:
+        Header data including name, email, skills, etc.
+    """
+    return _query("getHeader")
+
+def get_education() -> Optional[Dict]:
+    """
+    Get education information
+
+    Returns:
+        Education data including university, degree, major, etc.
+    """
+    return _query("getEducation")
+
+def get_experience() -> List[Dict]:
+    """
+    Get all experience entries
+
+    Returns:
+        List of experience entries with title, position, dates, etc.
+    """
+    return _query("getExperience")
+
+def get_projects() -> List[Dict]:
+    """
+    Get all project entries
+
+    Returns:
+        List of project entries with title, awards, highlights, etc.
+    """
+    return _query("getProjects")
+
+def export_resume_to_json(filename: str = "resume_data.json", pretty: bool = False,
+                          data: Optional[Dict] = None) -> str:
+    """
+    Export all resume data to a JSON file
+
+    Args:
+        filename: Name of the output JSON file
+        pretty: Indent the output by 2 spaces for human readers
+        data: Already fetched resume data, fetched from Convex if not given
+
+    Returns:
+        Path to the created file
+    """
+    resume_data = data if data is not None else get_full_resume()
+
+    # Tolerate non-string keys (e.g. numeric skill buckets) the way json.dump would
+    option = orjson.OPT_NON_STR_KEYS
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+
+    # orjson serializes straight to UTF-8 bytes, so write in binary mode
+    with open(filename, 'wb') as f:
+        f.write(orjson.dumps(resume_data, option=option))
+
+    print(f"Resume data exported to {filename}")
+    return filename
+
+def print_resume_summary(data: Optional[Dict] = None):
+    """
+    Print a summary of the resume data
+
+    Args:
+        data: Already fetched resume data, fetched from Convex if not given
+    """
+    try:
+        if data is None:
+            data = get_full_resume()
+
+        print("=== RESUME DATA SUMMARY ===")
+
+        # Header info
+        if data.get('header'):
+            header = data['header']
+            print(f"Name: {header.get('name', 'N/A')}")
+            print(f"Email: {header.get('email', 'N/A')}")
+            print(f"Tagline: {header.get('tagline', 'N/A')}")
+
+            if header.get('skills'):
+                skills = header['skills']
+                total_skills = sum(map(len, filter(None, skills.values())))
+                print(f"Total Skills: {total_skills}")
+
+        # Education
+        if data.get('education'):
+            edu = data['education']
+            print(f"Education: {edu.get('degree', 'N/A')} in {edu.get('major', 'N/A')} from {edu.get('university', 'N/A')}")
+
+        # Experience count
+        exp_count = len(data.get('experience', []))
+        print(f"Experience Entries: {exp_count}")
+
+        # Projects count
+        proj_count = len(data.get('projects', []))
+        print(f"Project Entries: {proj_count}")
+
+        print("========================")
+
+    except Exception as e:
+        print(f"Error fetching resume data: {e}")
+
+def entry_bullets(entry: Dict) -> List[str]:
+    """
+    Get the bullet points for an experience or project entry
+
+    Args:
+        entry: Experience or project dictionary
+
+    Returns:
+        The entry's highlights, or its description split into sentences
+    """
+    if entry.get('highlights'):
+        return entry['highlights']
+
+    sentences = SENTENCE_END_RE.split(entry.get('description') or '')
+    return [sentence.strip() for sentence in sentences if sentence.strip()]
+
+@lru_cache(maxsize=32)
+def render_preamble(name: str, font_size: float, margins: float, line_spacing: float) -> str:
+    """
+    Fill in the LaTeX preamble, reusing the result for repeated exports with the same settings
+
+    Args:
+        name: LaTeX-escaped name used for the PDF title and author
+        font_size: Body font size in points
+        margins: Left and right page margins in centimeters
+        line_spacing: Multiplier applied to the default 1.2x baseline skip
+
+    Returns:
+        The filled-in preamble
+    """
+    return LATEX_PREAMBLE_TEMPLATE.format(
+        title=name or 'Resume',
+        author=name,
+        font_size=font_size,
+        baseline_skip=round(font_size * 1.2 * line_spacing, 2),
+        margins=margins,
+    )
+
+def ensure_url_protocol(url: str) -> str:
+    """
+    Prefix a URL with https:// unless it already has a protocol, so hyperref
+    doesn't treat it as a relative file link
+    """
+    if url.startswith(('http://', 'https://')):
+        return url
+
+    return f"https://{url}"
+
+def display_url(url: str) -> str:
+    """
+    Shorten a URL for display by dropping the protocol, www. and trailing slash
+    """
+    return URL_DISPLAY_RE.sub('', url)
+
+def escape_resume(value: Any, key: Optional[str] = None) -> Any:
+    """
+    Recursively LaTeX-escape every string in resume data
+
+    URL and email fields are left raw since they are used as link targets
+    and shortened for display before being escaped.
+
+    Args:
+        value: Resume data, or any nested value inside it
+        key: Dictionary key the value was found under
+
+    Returns:
+        A copy of the data with escaped strings
+    """
+    if isinstance(value, str):
+        return value if key in RAW_FIELDS else escape_latex(value)
+    if isinstance(value, dict):
+        return {k: escape_resume(v, k) for k, v in value.items()}
+    if isinstance(value, list):
+        return [escape_resume(item, key) for item in value]
+    return value
+
+def escape_latex(text: str) -> str:
+    """
+    Escape special LaTeX characters in text
+    """
+    if not text:
+        return ""
+
+    # Most bullets contain nothing to escape, so avoid building a copy
+    if not LATEX_SPECIAL_RE.search(text):
+        return text
+
+    return text.translate(LATEX_ESCAPE_TABLE)
+
+# Pure Python version, kept reachable so the compiled one can be checked against it
+escape_latex_python = escape_latex
+
+if _latex_escape is not None:
+    escape_latex = _latex_escape.escape_latex
+
+# Skill names, courses, companies and dates repeat across entries and exports
+escape_latex = lru_cache(maxsize=4096)(escape_latex)
+
+def _write_header(f: TextIO, header: Dict, name: str):
+    """
+    Write the name, tagline and contact line block
+    """
+    tagline = f"        \\textit{{{header['tagline']}}}\n" if header.get('tagline') else ""
+
+    # Build contact line with separators
+    contact_items = []
+    for field, link_prefix, is_url in CONTACT_FIELDS:
+        value = header.get(field)
+        if not value:
+            continue
+
+        if is_url:
+            display = display_url(value)
+            value = ensure_url_protocol(value)
+        else:
+            display = value
+        contact_items.append(f"\\mbox{{\\hrefWithoutArrow{{{link_prefix}{value}}}{{{escape_latex(display)}}}}}")
+
+    contact_line = f"        {CONTACT_SEPARATOR.join(contact_items)}\n" if contact_items else ""
+
+    f.write(
+        "\n"
+        "    \\begin{header}\n"
+        "        \n"
+        "    \\end{header}\n"
+        "\n"
+        "    \\begin{header}\n"
+        f"        \\fontsize{{25 pt}}{{25 pt}}\\selectfont {name}\n"
+        "\n"
+        "        \\normalsize\n"
+        "        \n"
+        f"{tagline}"
+        "        \n"
+        f"{contact_line}"
+        "    \\end{header}\n"
+        "\n"
+        "    \\vspace{5 pt - 0.3 cm}\n"
+    )
+
+def _write_education(f: TextIO, education: Dict):
+    """
+    Write the Education section
+    """
+    dates = f"{education.get('startDate', '')} – {education.get('endDate', '')}"
+
+    # University, Degree, Major
+    uni_line = f"\\textbf{{{education.get('university') or ''}}}"
+    degree, major = education.get('degree', ''), education.get('major', '')
+    if degree or major:
+        uni_line += f", {degree} in {major}"
+
+    gpa = education.get('gpa')
+    gpa_line = f"                \\item GPA: \\textbf{{{gpa}}}/\\textbf{{4.0}}\n" if gpa else ""
+
+    coursework = education.get('coursework')
+    coursework_line = f"                \\item \\textbf{{Coursework:}} {', '.join(coursework)}\n" if coursework else ""
+
+    f.write(
+        "\n"
+        "\\section{Education}\n"
+        "        \\begin{twocolentry}{\n"
+        f"            {dates}\n"
+        "        }\n"
+        f"            {uni_line}\\end{{twocolentry}}\n"
+        "\n"
+        "        \\vspace{0.10 cm}\n"
+        "        \\begin{onecolentry}\n"
+        "            \\begin{highlights}\n"
+        f"{gpa_line}"
+        f"{coursework_line}"
+        "            \\end{highlights}\n"
+        "        \\end{onecolentry}\n"
+    )
+
+def _write_experience(f: TextIO, experience_list: List[Dict]):
+    """
+    Write the Experience section
+    """
+    f.write("\n\\section{Experience}\n")
+
+    f.write(EXPERIENCE_SEPARATOR.join(
+        EXPERIENCE_ENTRY_TEMPLATE.format(
+            dates=f"{exp.get('startDate', '')} – {exp.get('endDate', '')}",
+            title=exp.get('title') or '',
+            position=f" - {exp['position']}" if exp.get('position') else '',
+            items=''.join(f"            \\item {highlight}\n" for highlight in entry_bullets(exp)),
+        )
+        for exp in experience_list
+    ))
+
+def _write_projects(f: TextIO, projects_list: List[Dict]):
+    """
+    Write the Projects section
+    """
+    f.write("\n\\section{Projects}\n")
+
+    for i, project in enumerate(projects_list):
+        # Title with optional link and awards
+        title = f"\\textbf{{{project.get('title') or ''}}}"
+        if project.get('link'):
+            title = f"\\href{{{ensure_url_protocol(project['link'])}}}{{{title}}}"
+        awards = ''.join(f" | \\textit{{{award}}}" for award in project.get('awards') or [])
+
+        if i > 0:
+            f.write(PROJECT_SEPARATOR)
+        f.write(PROJECT_ENTRY_TEMPLATE.format(
+            date=project.get('date') or '',
+            title=f"{title}{awards}",
+            items=''.join(f"                \\item {highlight}\n" for highlight in entry_bullets(project)),
+        ))
+
+def _write_skills(f: TextIO, skills: Dict):
+    """
+    Write the Skills section
+    """
+    skill_lines = [
+        f"        \\textbf{{{category_label}:}} {', '.join(skills[category_key])}"
+        for category_label, category_key in SKILL_CATEGORIES
+        if skills.get(category_key)
+    ]
+
+    # Line breaks go between categories only, not after the last one
+    skills_block = " \\\\\n".join(skill_lines) + "\n" if skill_lines else ""
+
+    f.write(
+        "\n"
+        "\\section{Skills}\n"
+        "    \\begin{onecolentry}\n"
+        f"{skills_block}"
+        "    \\end{onecolentry}\n"
+    )
+
+def export_to_latex(output_file: str = "resume.tex", font_size: float = 11,
+                    margins: float = 0.5, line_spacing: float = 1.0,
+                    selected_experience_ids: Optional[List[str]] = None,
+                    selected_project_ids: Optional[List[str]] = None,
+                    data: Optional[Dict] = None) -> str:
+    """
+    Export resume data to a complete LaTeX document
+
+    Args:
+        output_file: Output LaTeX file path
+        font_size: Body font size in points
+        margins: Left and right page margins in centimeters
+        line_spacing: Multiplier applied to the default 1.2x baseline skip
+        selected_experience_ids: Convex IDs of experiences to include, or None for all
+        selected_project_ids: Convex IDs of projects to include, or None for all
+        data: Already fetched resume data, fetched from Convex if not given
+
+    Returns:
+        Path to the created file
+    """
+    try:
+        data = get_filtered_resume(selected_experience_ids, selected_project_ids, data)
+
+        # Escape every text field up front so rendering below is pure string assembly
+        data = escape_resume(data)
+
+        header = data.get('header', {})
+        name = header.get('name') or ''
+
+        # Stream each section straight to the file instead of building the whole document in memory
+        with open(output_file, 'w', encoding='utf-8', newline='', buffering=1 << 16) as f:
+            # Add the LaTeX preamble (document setup, packages, custom commands)
+            f.write(render_preamble(name, font_size, margins, line_spacing))
+            f.write('\n')
+
+            if header:
+                _write_header(f, header, name)
+            if data.get('education'):
+                _write_education(f, data['education'])
+            if data.get('experience'):
+                _write_experience(f, data['experience'])
+            if data.get('projects'):
+                _write_projects(f, data['projects'])
+            if header and header.get('skills'):
+                _write_skills(f, header['skills'])
+
+            # Close document
+            f.write("\n\\end{document}\n")
+
+        print(f"LaTeX resume exported to {output_file}")
+        return output_file
+
+    except Exception as e:
+        print(f"Error exporting LaTeX resume: {e}")
+        return ""
+
+if __name__ == "__main__":
+    # Example usage
+    print("Connecting to Convex and fetching resume data...")
+
+    try:
+        # Fetch once and share the result between the summary and both exports
+        data = get_full_resume()
+        print_resume_summary(data)
+
+        # Export to JSON and LaTeX in backend/data, concurrently since both only read data
+        DATA_DIR.mkdir(parents=True, exist_ok=True)
+
+        async def export_all():
+            await asyncio.gather(
+                asyncio.to_thread(export_resume_to_json, str(DATA_DIR / "resume_data.json"), pretty=True, data=data),
+                asyncio.to_thread(export_to_latex, str(DATA_DIR / "resume.tex"), data=data),
+            )
+
+        asyncio.run(export_all())
+
+        # Get specific data
+        projects = data.get('projects') or []
+        print(f"\nFound {len(projects)} projects:")
+        for project in projects[:3]:  # Show first 3
+            print(f"- {project.get('title', 'Untitled')}")
+
+    except Exception as e:
+        print(f"Error: {e}")
+        print("\nMake sure:")
+        print("1. Your Convex development server is running")
+        print("2. The .env file contains the correct VITE_CONVEX_URL")
+        print("3. Your Convex functions are deployed and accessible")
\ No newline at end of file
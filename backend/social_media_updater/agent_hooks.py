@@ -0,0 +1,50 @@
+from browser_use import Agent
+
+# 'saved' when no form dialog is still open and no field is flagged invalid,
+# i.e. the save went through rather than the form showing errors
+SAVED_STATE_SCRIPT = (
+    "() => document.querySelector("
+    "'[role=dialog] form, [role=dialog] input, [role=dialog] textarea, [aria-invalid=true]'"
+    ") ? 'open' : 'saved'"
+)
+
+def stop_after_form_closes(form_url_marker: str):
+    """
+    Build an on_step_end hook that stops the agent once the form it was filling is saved
+
+    Saving an experience closes its form and returns to the page the form was
+    opened from. The hook only stops the agent when both hold: the URL is back
+    on that page (so a redirect to a login, checkpoint or error page doesn't
+    count) and the page no longer shows an open form or invalid fields. That
+    saves the extra "double-checking" steps the agent would otherwise take.
+
+    Args:
+        form_url_marker: Substring of the URL while the form is open
+
+    Returns:
+        Async hook to pass as agent.run(on_step_end=...)
+    """
+    return_url = None
+
+    async def on_step_end(agent: Agent) -> None:
+        nonlocal return_url
+        url = await agent.browser_session.get_current_page_url()
+
+        if form_url_marker in url:
+            # The page the form belongs to, e.g. the profile it was opened on
+            return_url = url[:url.index(form_url_marker)].rstrip("?&/")
+            return
+
+        if return_url is None or not url.startswith(return_url):
+            return
+
+        try:
+            page = await agent.browser_session.get_current_page()
+            saved = page is not None and await page.evaluate(SAVED_STATE_SCRIPT) == "saved"
+        except Exception:
+            saved = False
+
+        if saved:
+            agent.stop()
+
+    return on_step_end
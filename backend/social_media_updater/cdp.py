@@ -0,0 +1,204 @@
+import asyncio
+import time
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional
+import httpx
+import orjson
+import websockets
+
+# Sets an input's value through the native setter and fires an input event,
+# so framework-controlled fields (React etc.) pick up the change
+FILL_LOGIN_FORM_SCRIPT = """
+(() => {{
+    const user = document.querySelector({username_selector});
+    const pass = document.querySelector({password_selector});
+    if (!user || !pass) return false;
+    const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    for (const [el, value] of [[user, {username}], [pass, {password}]]) {{
+        setValue.call(el, value);
+        el.dispatchEvent(new Event('input', {{ bubbles: true }}));
+    }}
+    const form = pass.form;
+    const submit = form && form.querySelector('button[type=submit], input[type=submit]');
+    if (submit) submit.click();
+    else if (form) form.requestSubmit();
+    else return false;
+    return true;
+}})()
+"""
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Shared HTTP client for DevTools endpoint requests
+
+    Pooled so repeated target lookups and liveness probes against the same
+    (cloud) browser reuse one kept-alive TLS connection.
+    """
+    return httpx.AsyncClient(
+        timeout=5,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=8, keepalive_expiry=60)
+    )
+
+class CDPSession:
+    """
+    Minimal Chrome DevTools Protocol client over a page target's websocket
+
+    Example:
+        async with CDPSession(ws_url) as cdp:
+            await cdp.send("Page.navigate", {"url": "https://example.com"})
+    """
+
+    def __init__(self, ws_url: str):
+        self.ws_url = ws_url
+        self._ws = None
+        self._next_id = 0
+        self._events: List[Dict] = []
+
+    async def __aenter__(self) -> "CDPSession":
+        self._ws = await websockets.connect(self.ws_url, max_size=None)
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self._ws.close()
+
+    async def send(self, method: str, params: Optional[Dict] = None) -> Dict:
+        """Send a command and wait for its result, buffering any events received meanwhile"""
+        self._next_id += 1
+        message_id = self._next_id
+        await self._ws.send(orjson.dumps({"id": message_id, "method": method, "params": params or {}}))
+
+        while True:
+            message = orjson.loads(await self._ws.recv())
+            if message.get("id") == message_id:
+                if "error" in message:
+                    raise RuntimeError(f"{method} failed: {message['error'].get('message')}")
+                return message.get("result", {})
+            if "method" in message:
+                self._events.append(message)
+
+    async def wait_for_event(self, method: str, timeout: float = 15) -> Dict:
+        """Wait for the next event with the given method name"""
+        for i, event in enumerate(self._events):
+            if event["method"] == method:
+                return self._events.pop(i)
+
+        async def receive() -> Dict:
+            while True:
+                message = orjson.loads(await self._ws.recv())
+                if message.get("method") == method:
+                    return message
+                if "method" in message:
+                    self._events.append(message)
+
+        return await asyncio.wait_for(receive(), timeout)
+
+    async def evaluate(self, expression: str):
+        """Evaluate a JavaScript expression in the page and return its value"""
+        result = await self.send("Runtime.evaluate", {"expression": expression, "returnByValue": True})
+        return result.get("result", {}).get("value")
+
+async def page_websocket_url(cdp_url: str, target_id: Optional[str] = None) -> Optional[str]:
+    """
+    Look up the websocket URL of a page target
+
+    Args:
+        cdp_url: CDP URL of the browser
+        target_id: ID of the tab to use, e.g. the agent's focused target. Without
+            it, the browser must have exactly one page, since guessing among
+            several tabs could act on the wrong one.
+
+    Returns:
+        The target's websocket URL, or None if it can't be identified
+    """
+    response = await get_http_client().get(f"{cdp_url.rstrip('/')}/json/list")
+    response.raise_for_status()
+    pages = [target for target in response.json() if target.get("type") == "page"]
+
+    if target_id is not None:
+        pages = [target for target in pages if target.get("id") == target_id]
+
+    return pages[0]["webSocketDebuggerUrl"] if len(pages) == 1 else None
+
+async def fill_login_form(
+    cdp_url: str,
+    login_url: str,
+    username_selector: str,
+    password_selector: str,
+    credentials: Dict,
+    target_id: Optional[str] = None,
+    timeout: float = 15
+) -> Optional[str]:
+    """
+    Log in through a known login form with direct CDP commands instead of an LLM agent
+
+    Args:
+        cdp_url: CDP URL of the browser
+        login_url: URL of the login page
+        username_selector: CSS selector of the username input
+        password_selector: CSS selector of the password input
+        credentials: Dictionary with username and password
+        target_id: ID of the tab to log in on (see page_websocket_url)
+        timeout: Seconds to wait for each page transition
+
+    Returns:
+        URL the page landed on after submitting, or None if the form could not be filled
+    """
+    ws_url = await page_websocket_url(cdp_url, target_id)
+    if not ws_url:
+        return None
+
+    script = FILL_LOGIN_FORM_SCRIPT.format(
+        username_selector=orjson.dumps(username_selector).decode(),
+        password_selector=orjson.dumps(password_selector).decode(),
+        username=orjson.dumps(credentials["username"]).decode(),
+        password=orjson.dumps(credentials["password"]).decode()
+    )
+
+    async with CDPSession(ws_url) as cdp:
+        await cdp.send("Page.enable")
+        await cdp.send("Page.navigate", {"url": login_url})
+        await cdp.wait_for_event("Page.loadEventFired", timeout)
+
+        if not await cdp.evaluate(script):
+            return None
+
+        # Single-page apps may not fire a load event, so poll for the URL to change
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            current_url = await cdp.evaluate("location.href")
+            if not current_url.startswith(login_url):
+                return current_url
+            await asyncio.sleep(0.25)
+
+        return await cdp.evaluate("location.href")
+
+async def navigate_current_page(
+    cdp_url: str,
+    build_url: Callable[[str], str],
+    target_id: Optional[str] = None,
+    timeout: float = 15
+) -> str:
+    """
+    Navigate the browser's page to a URL derived from the one it is on, with a single CDP command
+
+    Args:
+        cdp_url: CDP URL of the browser
+        build_url: Maps the current page URL to the URL to open
+        target_id: ID of the tab to navigate (see page_websocket_url)
+        timeout: Seconds to wait for the new page to load
+
+    Returns:
+        The URL navigated to
+    """
+    ws_url = await page_websocket_url(cdp_url, target_id)
+    if not ws_url:
+        raise RuntimeError("Could not identify the page target to navigate")
+
+    async with CDPSession(ws_url) as cdp:
+        url = build_url(await cdp.evaluate("location.href"))
+        await cdp.send("Page.enable")
+        await cdp.send("Page.navigate", {"url": url})
+        await cdp.wait_for_event("Page.loadEventFired", timeout)
+
+    return url
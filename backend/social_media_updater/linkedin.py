@@ -1,18 +1,36 @@
 import asyncio
 import os
+from contextlib import suppress
 from dotenv import load_dotenv
-from browser_use import Agent, Browser, ChatOpenAI
+from browser_use import Agent, Browser
+from llm import LLM
+from cdp import fill_login_form
+from agent_hooks import stop_after_form_closes
+from log import logger
 
 # Load from .env.local file
-load_dotenv('../../.env.local')
+load_dotenv(os.path.join(os.path.dirname(__file__), "..", "..", ".env.local"))
 
-async def activate_linkedin_agent(action: str, information: dict, cdp_url: str):
-    browser = Browser(
-        cdp_url=cdp_url, 
-        # use_cloud=True
-    )
+# Run the login browser on Browser Use cloud instead of locally (BROWSER_USE_CLOUD=1)
+USE_CLOUD = os.getenv("BROWSER_USE_CLOUD", "0") == "1"
+# Country to place the cloud browser's proxy in (e.g. "us", "uk", "de"); keep it close to the sites we drive
+CLOUD_PROXY_COUNTRY = os.getenv("BROWSER_USE_PROXY_COUNTRY") or None
 
-    await browser.start()
+# Part of the page URL while the add-experience form is open
+LINKEDIN_POSITION_FORM_MARKER = "/edit/forms/position/new"
+
+LINKEDIN_LOGIN_URL = "https://www.linkedin.com/login"
+
+async def activate_linkedin_agent(action: str, information: dict, cdp_url: str = None, browser: Browser = None):
+    # Reuse the logged-in browser when we have it, only reconnect over CDP otherwise
+    if browser is None:
+        browser = Browser(
+            cdp_url=cdp_url, 
+            # use_cloud=True
+            keep_alive=True
+        )
+
+        await browser.start()
 
     task = f"""
     *** IMPORTANT: ***
@@ -30,18 +48,30 @@ async def activate_linkedin_agent(action: str, information: dict, cdp_url: str):
         - END your process
     """
 
-    agent = Agent(task=task, llm=ChatOpenAI(model='gpt-4.1-mini'), browser=browser)
+    agent = Agent(task=task, llm=LLM, browser=browser)
 
-    await agent.run()
+    # Stop as soon as the saved form closes instead of letting the agent keep checking
+    await agent.run(on_step_end=stop_after_form_closes(LINKEDIN_POSITION_FORM_MARKER))
 
-async def init_browser_with_linkedin_login(credentials: dict) -> str:
-    browser = Browser(
-        # use_cloud=True,
-        keep_alive=True
-    )
+async def _log_in_to_linkedin(browser: Browser, credentials: dict):
+    await browser.start()
+
+    # Fill the known login form directly over CDP; fall back to the agent if the
+    # selectors changed or LinkedIn asks for a CAPTCHA/verification step
+    try:
+        landed_url = await fill_login_form(
+            browser.cdp_url, LINKEDIN_LOGIN_URL, "#username", "#password", credentials,
+            target_id=browser.agent_focus_target_id
+        )
+    except Exception as e:
+        logger.warning("Direct LinkedIn login failed, falling back to the agent: %s", e)
+        landed_url = None
+
+    if landed_url and "/feed" in landed_url:
+        return
 
     task = f"""
-    - Navigate to https://www.linkedin.com/login
+    - Navigate to https://www.linkedin.com/login unless you are already past the login page
     - Locate the username input field and enter the username: {credentials['username']}
     - Locate the password input field and enter the password: {credentials['password']}
     - Click the 'Sign in' button to log in to the account
@@ -53,13 +83,29 @@ async def init_browser_with_linkedin_login(credentials: dict) -> str:
 
     agent = Agent(
         task=task, 
-        llm=ChatOpenAI(model='gpt-4.1-mini'), 
+        llm=LLM, 
         browser=browser
     )
 
     await agent.run()
 
-    return browser.cdp_url
+async def init_browser_with_linkedin_login(credentials: dict) -> tuple[Browser, str]:
+    browser = Browser(
+        use_cloud=USE_CLOUD,
+        cloud_proxy_country_code=CLOUD_PROXY_COUNTRY if USE_CLOUD else None,
+        keep_alive=True
+    )
+
+    try:
+        await _log_in_to_linkedin(browser, credentials)
+    except BaseException:
+        # A failed or cancelled login (e.g. the caller gave up early) would
+        # otherwise leave the keep_alive browser running
+        with suppress(Exception):
+            await browser.kill()
+        raise
+
+    return browser, browser.cdp_url
 
 
 
@@ -81,9 +127,9 @@ async def main():
         "password": os.getenv("LINKEDIN_PASSWORD")
     }
 
-    cdp_url = await init_browser_with_linkedin_login(credentials)
+    browser, _ = await init_browser_with_linkedin_login(credentials)
 
-    await activate_linkedin_agent(action, information, cdp_url)
+    await activate_linkedin_agent(action, information, browser=browser)
 
 async def test():
     action = "add"  # or "edit"
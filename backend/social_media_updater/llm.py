@@ -0,0 +1,64 @@
+import hashlib
+import os
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+import orjson
+from browser_use import ChatOpenAI
+
+# How long (seconds) an identical agent LLM call is answered from memory, and how many are kept
+LLM_CACHE_TTL = float(os.getenv("LLM_CACHE_TTL", "3600"))
+LLM_CACHE_SIZE = 256
+
+@lru_cache(maxsize=32)
+def _schema_digest(output_format: Optional[type]) -> str:
+    # Agents build a fresh output model per run, so key on its schema rather than its identity
+    if output_format is None:
+        return ""
+    return hashlib.sha256(orjson.dumps(output_format.model_json_schema())).hexdigest()
+
+class CachingLLM:
+    """
+    Wraps a browser-use chat model and memoizes identical invocations
+
+    Repeated runs of the same task start from the same prompt, so their
+    opening steps are answered from memory instead of another model call.
+    Only exact matches of (model, messages, output format) are reused.
+    """
+
+    def __init__(self, llm: Any, ttl: float = LLM_CACHE_TTL, max_entries: int = LLM_CACHE_SIZE):
+        self._llm = llm
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._cache: Dict[str, tuple] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        # Everything but ainvoke (model, provider, name, ...) comes from the wrapped model
+        return getattr(self._llm, name)
+
+    def _key(self, messages: List[Any], output_format: Optional[type], kwargs: Dict) -> str:
+        payload = orjson.dumps(
+            [self._llm.model, [message.model_dump(mode="json") for message in messages], kwargs],
+            default=str
+        )
+        return hashlib.sha256(payload + _schema_digest(output_format).encode()).hexdigest()
+
+    async def ainvoke(self, messages: List[Any], output_format: Optional[type] = None, **kwargs: Any) -> Any:
+        key = self._key(messages, output_format, kwargs)
+        now = time.monotonic()
+
+        cached = self._cache.get(key)
+        if cached and now - cached[0] < self._ttl:
+            return cached[1]
+
+        result = await self._llm.ainvoke(messages, output_format, **kwargs)
+
+        # Dicts keep insertion order, so the first key is the oldest entry
+        if len(self._cache) >= self._max_entries:
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[key] = (now, result)
+
+        return result
+
+# Shared by every LinkedIn and Simplify agent so their calls hit the same cache
+LLM = CachingLLM(ChatOpenAI(model='gpt-4.1-mini'))
@@ -0,0 +1,197 @@
+import asyncio
+import json
+import os
+from contextlib import suppress
+from textwrap import dedent
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from dotenv import load_dotenv
+from browser_use import Agent, Browser
+from llm import LLM
+from cdp import fill_login_form, navigate_current_page
+from agent_hooks import stop_after_form_closes
+from log import logger
+
+# Load from .env.local file
+load_dotenv(os.path.join(os.path.dirname(__file__), "..", "..", ".env.local"))
+
+# Run the login browser on Browser Use cloud instead of locally (BROWSER_USE_CLOUD=1)
+USE_CLOUD = os.getenv("BROWSER_USE_CLOUD", "0") == "1"
+# Country to place the cloud browser's proxy in (e.g. "us", "uk", "de"); keep it close to the sites we drive
+CLOUD_PROXY_COUNTRY = os.getenv("BROWSER_USE_PROXY_COUNTRY") or None
+
+# Part of the page URL while the add-experience form is open
+SIMPLIFY_EXPERIENCE_FORM_MARKER = "sidebar=experience-new"
+
+# Static agent instructions; per-call values are appended after these
+SIMPLIFY_TASK_PROMPT = dedent("""
+    *** IMPORTANT: ***
+    - Fill out the fields with the information in the DYNAMIC section at the end.
+    - If currentlyWorkingHere is True, do not fill out the endDate field.
+    - The description field is a list of strings; each string is one bullet point in the description section.
+    - For dropdown fields (company/organization included), type the value, then press "Tab" and "Enter" to select the first option.
+    - A red "Required" text under a field means it is required; if you are not given the information, put in your best guess.
+    - If asked to post job update: click Skip.
+""")
+
+# Steps for each supported action, appended after the shared instructions
+SIMPLIFY_ACTION_STEPS = {
+    "add": dedent("""
+        - If the add experience form is not open, add ?sidebar=experience-new to the end of the URL and hit enter
+        - Fill in the fields
+        - Save the changes by clicking the 'Save' button
+        - END your process
+    """),
+}
+
+SIMPLIFY_LOGIN_URL = "https://simplify.jobs/auth/login"
+SIMPLIFY_USERNAME_SELECTOR = "input[type=email], input[name=email]"
+SIMPLIFY_PASSWORD_SELECTOR = "input[type=password]"
+
+SIMPLIFY_PROFILE_PROMPT = dedent("""
+    - You are already logged in to Simplify.
+    - Click on the profile picture icon on the top right, then click on "my profile" to go to the profile page.
+""")
+
+SIMPLIFY_LOGIN_PROMPT = dedent("""
+    - Navigate to https://simplify.jobs/auth/login
+    - Locate the username input field and enter the username given in the DYNAMIC section at the end
+    - Locate the password input field and enter the password given in the DYNAMIC section at the end
+    - Click the 'Sign in' button to log in to the account
+    - Ensure that the login is successful by checking if the user is redirected to their Simplify feed.
+    - If login was successful, click on the profile picture icon on the top right, then click on "my profile" to go to the profile page.
+""")
+
+def with_experience_sidebar(url: str) -> str:
+    """Return the profile URL with the add-experience sidebar query parameter set"""
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query))
+    query["sidebar"] = "experience-new"
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+async def activate_simplify_agent(action: str, information: dict, cdp_url: str = None, browser: Browser = None):
+    steps = SIMPLIFY_ACTION_STEPS.get(action)
+    if steps is None:
+        raise ValueError(f"Unsupported Simplify action: {action}")
+
+    # Reuse the logged-in browser when we have it, only reconnect over CDP otherwise
+    if browser is None:
+        browser = Browser(
+            cdp_url=cdp_url, 
+            # use_cloud=True
+            keep_alive=True
+        )
+
+        await browser.start()
+
+    # Open the add-experience sidebar with one CDP navigation rather than having
+    # the agent edit the address bar key by key
+    if action == "add":
+        try:
+            # Navigate the tab the agent is focused on, not just any tab of a reused session
+            await navigate_current_page(
+                browser.cdp_url, with_experience_sidebar, target_id=browser.agent_focus_target_id
+            )
+        except Exception as e:
+            logger.warning("Could not open the Simplify experience sidebar directly, leaving it to the agent: %s", e)
+
+    # Keep the instructions free of interpolation and append the per-call values
+    # at the end, so the prompt prefix stays identical across calls and is
+    # eligible for the model provider's prompt caching
+    task = SIMPLIFY_TASK_PROMPT + steps + f"---\nDYNAMIC:\ninformation={json.dumps(information, sort_keys=True)}\n"
+
+    agent = Agent(task=task, llm=LLM, browser=browser)
+
+    # Stop as soon as the saved form closes instead of letting the agent keep checking
+    await agent.run(on_step_end=stop_after_form_closes(SIMPLIFY_EXPERIENCE_FORM_MARKER))
+
+async def _log_in_to_simplify(browser: Browser, credentials: dict):
+    await browser.start()
+
+    # Fill the known login form directly over CDP and only use the agent to reach
+    # the profile page; fall back to the full agent login if the form changed
+    try:
+        landed_url = await fill_login_form(
+            browser.cdp_url, SIMPLIFY_LOGIN_URL, SIMPLIFY_USERNAME_SELECTOR, SIMPLIFY_PASSWORD_SELECTOR, credentials,
+            target_id=browser.agent_focus_target_id
+        )
+    except Exception as e:
+        logger.warning("Direct Simplify login failed, falling back to the agent: %s", e)
+        landed_url = None
+
+    if landed_url and "/auth/" not in landed_url:
+        agent = Agent(task=SIMPLIFY_PROFILE_PROMPT, llm=LLM, browser=browser)
+        await agent.run()
+        return
+
+    task = SIMPLIFY_LOGIN_PROMPT + f"---\nDYNAMIC:\nusername={credentials['username']}\npassword={credentials['password']}\n"
+
+    agent = Agent(
+        task=task, 
+        llm=LLM, 
+        browser=browser
+    )
+
+    await agent.run()
+
+async def init_browser_with_simplify_login(credentials: dict) -> tuple[Browser, str]:
+    browser = Browser(
+        use_cloud=USE_CLOUD,
+        cloud_proxy_country_code=CLOUD_PROXY_COUNTRY if USE_CLOUD else None,
+        keep_alive=True
+    )
+
+    try:
+        await _log_in_to_simplify(browser, credentials)
+    except BaseException:
+        # A failed or cancelled login (e.g. the caller gave up early) would
+        # otherwise leave the keep_alive browser running
+        with suppress(Exception):
+            await browser.kill()
+        raise
+
+    return browser, browser.cdp_url
+
+
+
+async def main():
+    action = "add"  # or "edit"
+    information = {
+      "title": "Growth Engineering Intern",
+      "employmentType": "Internship",
+      "companyName": "Browser Use",
+      "currentlyWorkingHere": True,
+      "startDate": "September 2025",
+      "endDate": "December 2025",
+      "description": [
+        "100 demos, 100 days"
+      ]
+    }
+    credentials = {
+        "username": os.getenv("SIMPLIFY_USERNAME"),
+        "password": os.getenv("SIMPLIFY_PASSWORD")
+    }
+
+    browser, _ = await init_browser_with_simplify_login(credentials)
+
+    await activate_simplify_agent(action, information, browser=browser)
+
+async def test():
+    browser = Browser(
+        keep_alive=True
+    )
+    await browser.start()
+
+    task=f"""
+
+    """
+
+    agent = Agent(
+        task=task, 
+        llm=LLM,
+        browser=browser
+    )
+
+    await agent.run()
+
+if __name__ == '__main__':
+  asyncio.run(main())
\ No newline at end of file
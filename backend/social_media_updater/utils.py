@@ -0,0 +1,579 @@
+import asyncio
+import fcntl
+import os
+import re
+import sys
+import time
+import httpx
+import orjson
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from dotenv import load_dotenv
+from linkedin import init_browser_with_linkedin_login, activate_linkedin_agent
+from simplify import init_browser_with_simplify_login, activate_simplify_agent, SIMPLIFY_ACTION_STEPS
+from cdp import get_http_client
+from log import logger
+
+# Add backend directory to path to import the resume_builder package
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+def get_experience():
+    """Fetch experiences from Convex, importing the resume builder only on first use"""
+    from resume_builder.utils import get_experience as fetch_experience
+    return fetch_experience()
+
+load_dotenv()
+
+# Logged-in browser sessions are remembered per provider and username, so later
+# runs can reconnect over CDP instead of logging in again. The file holds live
+# CDP URLs, so it lives in the user's cache directory, readable only by them.
+SESSION_CACHE_FILE = Path(
+    os.getenv("SESSION_CACHE_DIR") or Path.home() / ".cache" / "resume-use"
+) / "sessions.json"
+SESSION_CACHE_TTL = float(os.getenv("SESSION_CACHE_TTL", "1200"))
+# A session is leased to one caller at a time so two agents never drive the same
+# tab; leases expire after this long in case the holder died without releasing
+SESSION_LEASE_TTL = float(os.getenv("SESSION_LEASE_TTL", "900"))
+
+# Login credentials, read from the environment once at import
+CREDENTIALS = {
+    "linkedin": {
+        "username": os.getenv("LINKEDIN_USERNAME"),
+        "password": os.getenv("LINKEDIN_PASSWORD")
+    },
+    "simplify": {
+        "username": os.getenv("SIMPLIFY_USERNAME"),
+        "password": os.getenv("SIMPLIFY_PASSWORD")
+    },
+}
+
+def _session_key(provider: str, username: str) -> str:
+    return f"{provider}:{username}"
+
+@contextmanager
+def _locked_session_cache() -> Iterator[Dict]:
+    """
+    Read the session cache under an exclusive file lock and write it back on exit
+
+    The lock makes lease checks atomic across tasks and across worker processes.
+    """
+    SESSION_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(SESSION_CACHE_FILE, os.O_RDWR | os.O_CREAT, 0o600)
+    with os.fdopen(fd, "r+b") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            cache = orjson.loads(f.read() or b"{}")
+        except orjson.JSONDecodeError:
+            cache = {}
+
+        yield cache
+
+        f.seek(0)
+        f.truncate()
+        f.write(orjson.dumps(cache, option=orjson.OPT_INDENT_2))
+
+def release_cached_session(provider: str, username: str, cdp_url: str) -> None:
+    """Hand a leased session back so the next caller can reuse it"""
+    with _locked_session_cache() as cache:
+        for entry in cache.get(_session_key(provider, username), []):
+            if entry["cdp_url"] == cdp_url:
+                entry["leased_until"] = 0
+
+def evict_cached_session(provider: str, username: str, cdp_url: str) -> None:
+    """Forget a cached browser session, e.g. after an agent failure"""
+    with _locked_session_cache() as cache:
+        key = _session_key(provider, username)
+        cache[key] = [entry for entry in cache.get(key, []) if entry["cdp_url"] != cdp_url]
+
+def _lease_cached_session(provider: str, username: str, skip: set) -> Optional[str]:
+    """Lease the first fresh, unleased cached session not in skip, dropping expired ones"""
+    now = time.time()
+    with _locked_session_cache() as cache:
+        key = _session_key(provider, username)
+        entries = [entry for entry in cache.get(key, []) if now - entry["created_at"] < SESSION_CACHE_TTL]
+        cache[key] = entries
+        for entry in entries:
+            if entry["cdp_url"] not in skip and entry["leased_until"] < now:
+                entry["leased_until"] = now + SESSION_LEASE_TTL
+                return entry["cdp_url"]
+    return None
+
+async def _cdp_session_alive(cdp_url: str) -> bool:
+    """Cheap liveness probe: ask the DevTools endpoint for its version info"""
+    try:
+        response = await get_http_client().get(f"{cdp_url.rstrip('/')}/json/version", timeout=1)
+        return response.status_code == 200
+    except httpx.HTTPError:
+        return False
+
+async def get_logged_in_session(
+    provider: str,
+    credentials: Dict,
+    login: Callable[[Dict], Awaitable[Tuple]]
+) -> Tuple:
+    """
+    Lease a cached logged-in browser session if one is free and live, otherwise log in
+
+    The session stays leased to the caller until release_cached_session (or
+    evict_cached_session) is called with its CDP URL.
+
+    Args:
+        provider: Name the session is cached under, e.g. 'linkedin'
+        credentials: Dictionary with username and password
+        login: The provider's init_browser_with_*_login function
+
+    Returns:
+        (browser, cdp_url) tuple; browser is None when reconnecting to a cached session
+    """
+    username = credentials["username"]
+    dead = set()
+
+    while cdp_url := _lease_cached_session(provider, username, dead):
+        if await _cdp_session_alive(cdp_url):
+            logger.info("Reusing cached %s session", provider)
+            return None, cdp_url
+        evict_cached_session(provider, username, cdp_url)
+        dead.add(cdp_url)
+
+    browser, cdp_url = await login(credentials)
+
+    if cdp_url:
+        with _locked_session_cache() as cache:
+            now = time.time()
+            cache.setdefault(_session_key(provider, username), []).append(
+                {"cdp_url": cdp_url, "created_at": now, "leased_until": now + SESSION_LEASE_TTL}
+            )
+
+    return browser, cdp_url
+
+# Employment type keywords matched in one case-insensitive pass over the title;
+# when several match, the earlier entry in EMPLOYMENT_TYPES wins
+EMPLOYMENT_TYPE_RE = re.compile(
+    r"(?P<intern>intern)|(?P<contract>contract)|(?P<part>part[- ]time)|(?P<freelance>freelance)|(?P<volunteer>volunteer)",
+    re.IGNORECASE
+)
+EMPLOYMENT_TYPES = (
+    ("intern", "Internship"),
+    ("contract", "Contract"),
+    ("part", "Part-time"),
+    ("freelance", "Freelance"),
+    ("volunteer", "Volunteer"),
+)
+
+# endDate values meaning the role is ongoing (an empty endDate counts too)
+CURRENT_END_DATES = frozenset(("present", "current", "ongoing", ""))
+
+def detect_employment_type(position: str) -> str:
+    """Map a job title to a LinkedIn/Simplify employment type, defaulting to Full-time"""
+    found = {match.lastgroup for match in EMPLOYMENT_TYPE_RE.finditer(position)}
+    if not found:
+        return "Full-time"
+    return next(label for group, label in EMPLOYMENT_TYPES if group in found)
+
+async def finish_login(provider: str, username: str, login_task: asyncio.Task) -> None:
+    """
+    Wind down a login task once the caller is done with it
+
+    A login that is still running is cancelled and waited for, since it kills
+    its keep_alive browser when cancelled. A login that produced a session hands
+    that session's lease back so other callers can reuse it.
+    """
+    if not login_task.done():
+        login_task.cancel()
+    # Retrieves the result too, so a failed login isn't reported as never retrieved
+    result, = await asyncio.gather(login_task, return_exceptions=True)
+    if isinstance(result, tuple) and result[1]:
+        release_cached_session(provider, username, result[1])
+
+def _format_experience(experience: Dict, *, description_key: str) -> Dict:
+    """
+    Convert an experience entry to the LinkedIn/Simplify agent format
+
+    Args:
+        experience: Experience dictionary with format:
+            - title: Company name
+            - position: Job title/position
+            - startDate: Start date
+            - endDate: End date or "Present"
+            - description (Convex, a string) or highlights (resume, a list): bullet points
+        description_key: Which of the two fields holds the bullet points
+
+    Returns:
+        Formatted dictionary for the LinkedIn or Simplify agent
+    """
+    # Determine if currently working there
+    currently_working = experience.get("endDate", "").strip().lower() in CURRENT_END_DATES
+
+    title = experience.get("position", experience.get("title", ""))
+    description = experience.get(description_key, [] if description_key == "highlights" else "")
+
+    linkedin_data = {
+        "title": title,  # Job title
+        "employmentType": detect_employment_type(title),
+        "companyName": experience.get("title", ""),  # Company name
+        "currentlyWorkingHere": currently_working,
+        "startDate": experience.get("startDate", ""),
+        "description": description if isinstance(description, list) else [description],
+        # Only include endDate if not currently working
+        **({} if currently_working else {"endDate": experience.get("endDate", "")})
+    }
+
+    return linkedin_data
+
+def format_convex_experience_for_linkedin(experience: Dict) -> Dict:
+    """Convert experience data from Convex to LinkedIn agent format"""
+    return _format_experience(experience, description_key="description")
+
+# Simplify's experience form takes the same fields as LinkedIn's
+format_convex_experience_for_simplify = format_convex_experience_for_linkedin
+
+async def update_simplify_from_convex(
+    experience_id: Optional[str] = None,
+    experience_index: Optional[int] = None,
+    action: str = "add"
+) -> bool:
+    """
+    Fetch experience from Convex and update Simplify profile
+
+    Args:
+        experience_id: Convex ID of the experience to add (_id field)
+        experience_index: Index of experience in the list (0-based)
+        action: 'add' or 'edit'
+
+    Returns:
+        Boolean indicating success
+
+    Example:
+        # Add first experience from Convex
+        await update_simplify_from_convex(experience_index=0)
+
+        # Add specific experience by ID
+        await update_simplify_from_convex(experience_id="j976qw7t4nh6jdpsfbjyqc68n17r2vpk")
+    """
+    if action not in SIMPLIFY_ACTION_STEPS:
+        logger.error("Unsupported Simplify action: %s", action)
+        return False
+
+    try:
+        # Check credentials before spending a Convex round-trip
+        credentials = CREDENTIALS["simplify"]
+
+        if not credentials["username"] or not credentials["password"]:
+            logger.warning("Simplify credentials not found in environment variables")
+            return False
+
+        # Get all experiences from Convex without blocking the event loop
+        experiences = await asyncio.to_thread(get_experience)
+
+        if not experiences:
+            logger.warning("No experiences found in Convex")
+            return False
+
+        # Find the specific experience
+        experience = None
+        if experience_id:
+            # Find by ID
+            experience = next((exp for exp in experiences if exp.get("_id") == experience_id), None)
+            if not experience:
+                logger.warning("Experience with ID %s not found", experience_id)
+                return False
+        elif experience_index is not None:
+            # Get by index
+            if 0 <= experience_index < len(experiences):
+                experience = experiences[experience_index]
+            else:
+                logger.warning("Experience index %s out of range (0-%s)", experience_index, len(experiences)-1)
+                return False
+        else:
+            # Default to first experience
+            experience = experiences[0]
+            logger.info("No experience specified, using first: %s", experience.get('title'))
+
+        # Format experience for Simplify
+        simplify_data = format_convex_experience_for_simplify(experience)
+
+        logger.info("Processing experience: %s at %s", simplify_data['title'], simplify_data['companyName'])
+
+        # Lease a cached session or log in
+        browser, cdp_url = await get_logged_in_session("simplify", credentials, init_browser_with_simplify_login)
+
+        # Add/edit the experience on Simplify in the same browser session
+        try:
+            await activate_simplify_agent(action, simplify_data, cdp_url, browser)
+        except Exception:
+            evict_cached_session("simplify", credentials["username"], cdp_url)
+            raise
+        finally:
+            release_cached_session("simplify", credentials["username"], cdp_url)
+
+        logger.info("Successfully %sed Simplify experience: %s at %s", action, simplify_data['title'], simplify_data['companyName'])
+        return True
+
+    except Exception as e:
+        logger.error("Error updating Simplify from Convex: %s", e)
+        return False
+
+async def update_linkedin_from_convex(
+    experience_id: Optional[str] = None,
+    experience_index: Optional[int] = None,
+    action: str = "add"
+) -> bool:
+    """
+    Fetch experience from Convex and update LinkedIn profile
+
+    Args:
+        experience_id: Convex ID of the experience to add (_id field)
+        experience_index: Index of experience in the list (0-based)
+        action: 'add' or 'edit'
+
+    Returns:
+        Boolean indicating success
+
+    Example:
+        # Add first experience from Convex
+        await update_linkedin_from_convex(experience_index=0)
+
+        # Add specific experience by ID
+        await update_linkedin_from_convex(experience_id="j976qw7t4nh6jdpsfbjyqc68n17r2vpk")
+    """
+    login_task = None
+    try:
+        # Get credentials
+        credentials = CREDENTIALS["linkedin"]
+
+        if not credentials["username"] or not credentials["password"]:
+            logger.warning("LinkedIn credentials not found in environment variables")
+            return False
+
+        # Start the browser login right away so it overlaps with fetching and formatting the experience
+        login_task = asyncio.create_task(
+            get_logged_in_session("linkedin", credentials, init_browser_with_linkedin_login)
+        )
+
+        # Get all experiences from Convex without blocking the event loop
+        experiences = await asyncio.to_thread(get_experience)
+
+        if not experiences:
+            logger.warning("No experiences found in Convex")
+            return False
+
+        # Find the specific experience
+        experience = None
+        if experience_id:
+            # Find by ID
+            experience = next((exp for exp in experiences if exp.get("_id") == experience_id), None)
+            if not experience:
+                logger.warning("Experience with ID %s not found", experience_id)
+                return False
+        elif experience_index is not None:
+            # Get by index
+            if 0 <= experience_index < len(experiences):
+                experience = experiences[experience_index]
+            else:
+                logger.warning("Experience index %s out of range (0-%s)", experience_index, len(experiences)-1)
+                return False
+        else:
+            # Default to first experience
+            experience = experiences[0]
+            logger.info("No experience specified, using first: %s", experience.get('title'))
+
+        # Format experience for LinkedIn
+        linkedin_data = format_convex_experience_for_linkedin(experience)
+
+        logger.info("Processing experience: %s at %s", linkedin_data['title'], linkedin_data['companyName'])
+
+        # Wait for the login started above
+        browser, cdp_url = await login_task
+
+        # Add/edit the experience on LinkedIn in the same browser session
+        try:
+            await activate_linkedin_agent(action, linkedin_data, cdp_url, browser)
+        except Exception:
+            evict_cached_session("linkedin", credentials["username"], cdp_url)
+            raise
+
+        logger.info("Successfully %sed LinkedIn experience: %s at %s", action, linkedin_data['title'], linkedin_data['companyName'])
+        return True
+
+    except Exception as e:
+        logger.error("Error updating LinkedIn from Convex: %s", e)
+        return False
+
+    finally:
+        # Don't leave a login running if we bailed out before needing it
+        if login_task is not None:
+            await finish_login("linkedin", credentials["username"], login_task)
+
+async def update_linkedin_bulk(
+    indices_or_ids: List[Union[int, str]],
+    action: str = "add"
+) -> List[bool]:
+    """
+    Fetch several experiences from Convex and update them on LinkedIn with a single login
+
+    Args:
+        indices_or_ids: Experiences to add, each either a Convex ID (_id field) or a 0-based index
+        action: 'add' or 'edit'
+
+    Returns:
+        One success flag per requested experience, in order
+
+    Example:
+        await update_linkedin_bulk([0, "j976qw7t4nh6jdpsfbjyqc68n17r2vpk"])
+    """
+    credentials = CREDENTIALS["linkedin"]
+
+    if not credentials["username"] or not credentials["password"]:
+        logger.warning("LinkedIn credentials not found in environment variables")
+        return [False] * len(indices_or_ids)
+
+    # Log in once for the whole batch, overlapping with the Convex fetch
+    login_task = asyncio.create_task(
+        get_logged_in_session("linkedin", credentials, init_browser_with_linkedin_login)
+    )
+    try:
+        experiences = await asyncio.to_thread(get_experience) or []
+        experiences_by_id = {exp.get("_id"): exp for exp in experiences}
+
+        selected = []
+        for key in indices_or_ids:
+            if isinstance(key, int):
+                experience = experiences[key] if 0 <= key < len(experiences) else None
+            else:
+                experience = experiences_by_id.get(key)
+            if experience is None:
+                logger.warning("Experience %s not found in Convex", key)
+            selected.append(experience)
+
+        if not any(selected):
+            return [False] * len(selected)
+
+        browser, cdp_url = await login_task
+
+        # Agents share the logged-in browser, so run them one after another
+        # rather than letting them fight over the same tab
+        results = []
+        for experience in selected:
+            if experience is None:
+                results.append(False)
+                continue
+
+            linkedin_data = format_convex_experience_for_linkedin(experience)
+            try:
+                await activate_linkedin_agent(action, linkedin_data, cdp_url, browser)
+                logger.info("Successfully %sed LinkedIn experience: %s at %s", action, linkedin_data['title'], linkedin_data['companyName'])
+                results.append(True)
+            except Exception as e:
+                evict_cached_session("linkedin", credentials["username"], cdp_url)
+                logger.error("Error updating LinkedIn experience %s: %s", linkedin_data['title'], e)
+                results.append(False)
+
+        return results
+
+    except Exception as e:
+        logger.error("Error updating LinkedIn from Convex: %s", e)
+        return [False] * len(indices_or_ids)
+
+    finally:
+        await finish_login("linkedin", credentials["username"], login_task)
+
+async def update_linkedin(
+    action: str = "add",
+    experience_data: Optional[Dict] = None,
+    use_existing_session: bool = False,
+    cdp_url: Optional[str] = None
+) -> bool:
+    """
+    Update LinkedIn profile with experience information
+
+    Args:
+        action: 'add' to add new experience, 'edit' to modify existing
+        experience_data: Dictionary containing:
+            - title: Job title
+            - employmentType: Type of employment (Full-time, Part-time, Internship, etc.)
+            - companyName: Name of the company
+            - currentlyWorkingHere: Boolean indicating if still working there
+            - startDate: Start date (format: "Month Year")
+            - endDate: End date (format: "Month Year") - omit if currentlyWorkingHere is True
+            - description: List of bullet points describing the role
+        use_existing_session: Whether to use an existing browser session
+        cdp_url: CDP URL of existing session (required if use_existing_session is True)
+
+    Returns:
+        Boolean indicating success
+
+    Example:
+        experience = {
+            "title": "Software Engineer",
+            "employmentType": "Full-time",
+            "companyName": "Tech Company",
+            "currentlyWorkingHere": False,
+            "startDate": "January 2023",
+            "endDate": "December 2023",
+            "description": [
+                "Developed scalable web applications",
+                "Implemented CI/CD pipelines"
+            ]
+        }
+        success = await update_linkedin("add", experience)
+    """
+    try:
+        # Use default experience data if none provided
+        if experience_data is None:
+            experience_data = {
+                "title": "Software Engineering Intern",
+                "employmentType": "Internship",
+                "companyName": "Tech Company",
+                "currentlyWorkingHere": True,
+                "startDate": "September 2024",
+                "description": [
+                    "Developing full-stack applications",
+                    "Collaborating with cross-functional teams"
+                ]
+            }
+
+        # Get LinkedIn credentials from environment
+        credentials = CREDENTIALS["linkedin"]
+
+        if not credentials["username"] or not credentials["password"]:
+            raise ValueError("LinkedIn credentials not found in environment variables")
+
+        # Initialize browser and login if not using existing session
+        browser = None
+        if not use_existing_session:
+            browser, cdp_url = await init_browser_with_linkedin_login(credentials)
+        elif not cdp_url:
+            raise ValueError("CDP URL required when using existing session")
+
+        # Activate the LinkedIn agent to perform the action
+        await activate_linkedin_agent(action, experience_data, cdp_url, browser)
+
+        logger.info("Successfully %sed LinkedIn experience: %s", action, experience_data.get('title', 'Unknown'))
+        return True
+
+    except Exception as e:
+        logger.error("Error updating LinkedIn: %s", e)
+        return False
+
+def format_experience_for_linkedin(experience: Dict) -> Dict:
+    """Convert experience data from resume format (bullet points under highlights) to LinkedIn format"""
+    return _format_experience(experience, description_key="highlights")
+
+# Main execution function for testing
+async def main():
+    """
+    Main function for testing LinkedIn updates from Convex
+    """
+    # Example: Add first experience from Convex to LinkedIn
+    success = await update_linkedin_from_convex(experience_index=0)
+
+    if success:
+        print("LinkedIn profile updated successfully!")
+    else:
+        print("Failed to update LinkedIn profile")
+
+if __name__ == "__main__":
+    asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Make the backend packages (resume_builder, ...) importable from the tests
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
@@ -0,0 +1,17 @@
+from resume_builder.utils import entry_bullets
+
+def test_description_splits_only_at_sentence_ends():
+    entry = {'description': 'Built APIs in Node.js. Cut latency 3.5x.  Shipped v2.0 to prod. '}
+    assert entry_bullets(entry) == ['Built APIs in Node.js', 'Cut latency 3.5x', 'Shipped v2.0 to prod']
+
+def test_description_without_final_period():
+    assert entry_bullets({'description': 'Led the team. Grew revenue by 1.5M'}) == ['Led the team', 'Grew revenue by 1.5M']
+
+def test_empty_or_missing_description():
+    assert entry_bullets({'description': ''}) == []
+    assert entry_bullets({'description': ' . '}) == []
+    assert entry_bullets({}) == []
+
+def test_highlights_take_precedence():
+    entry = {'highlights': ['One.', 'Two'], 'description': 'Ignored. Text.'}
+    assert entry_bullets(entry) == ['One.', 'Two']
@@ -0,0 +1,28 @@
+import pytest
+
+from resume_builder import utils
+
+compiled = pytest.importorskip(
+    "resume_builder._latex_escape",
+    reason="compiled escaper not built (python setup.py build_ext --inplace in resume_builder)"
+)
+
+SAMPLES = [
+    "",
+    "plain text",
+    "R&D 10% a\\b",
+    "$100 #1 snake_case {braces} ~tilde ^caret",
+    "&%$#_{}~^\\",
+    "ends with special &",
+    "& starts with special",
+    "unicode é ü 中文 & more",
+    "emoji 🚀 100%",
+]
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_compiled_matches_python(text):
+    assert compiled.escape_latex(text) == utils.escape_latex_python(text)
+
+def test_compiled_returns_original_when_nothing_to_escape():
+    text = "nothing special here"
+    assert compiled.escape_latex(text) is text
@@ -0,0 +1,41 @@
+import pytest
+from resume_builder import utils
+
+class FakeConvexClient:
+    def __init__(self):
+        self.queries = []
+
+    def query(self, name):
+        self.queries.append(name)
+        return {'header': {'name': f'fetch {len(self.queries)}'}}
+
+@pytest.fixture
+def client(monkeypatch):
+    fake = FakeConvexClient()
+    monkeypatch.setattr(utils, '_get_client', lambda: fake)
+    monkeypatch.setattr(utils, 'RESUME_CACHE_TTL', 60.0)
+    utils.invalidate_resume_cache()
+    yield fake
+    utils.invalidate_resume_cache()
+
+def test_repeated_fetch_hits_cache(client):
+    first = utils.get_full_resume()
+    assert utils.get_full_resume() is first
+    assert client.queries == ['resumeFunctions:getFullResume']
+
+def test_invalidate_forces_refetch(client):
+    first = utils.get_full_resume()
+    utils.invalidate_resume_cache()
+    assert utils.get_full_resume() != first
+    assert len(client.queries) == 2
+
+def test_use_cache_false_bypasses_cache(client):
+    utils.get_full_resume()
+    utils.get_full_resume(use_cache=False)
+    assert len(client.queries) == 2
+
+def test_zero_ttl_disables_cache(client, monkeypatch):
+    monkeypatch.setattr(utils, 'RESUME_CACHE_TTL', 0.0)
+    utils.get_full_resume()
+    utils.get_full_resume()
+    assert len(client.queries) == 2